@@ -4,9 +4,20 @@ Pytest configuration for Vidurai tests.
 Provides async test support and common fixtures.
 """
 
+import sys
+
 import pytest
 import asyncio
 
+# uvloop's loop implementation is markedly faster for socket-heavy
+# async tests; adopt it when installed (it does not support Windows)
+if sys.platform != 'win32':
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
 
 @pytest.fixture(scope="session")
 def event_loop():
@@ -12,6 +12,8 @@ import tempfile
 import urllib.request
 import urllib.error
 
+from vidurai.daemon.ipc.server import get_pipe_path
+
 # We want to ensure we're testing the isolated environment
 # The test runner should ideally invoke CLI via subprocess with manipulated HOME/TMPDIR
 # to guarantee perfect isolation, similar to the verified manual journey.
@@ -94,13 +96,36 @@ class TestBaselineJourney:
             s.bind(('', 0))
             return s.getsockname()[1]
             
+    def _daemon_listening(self, sock_path):
+        # Probe with a real connect(): abstract-namespace sockets
+        # (Linux) have no filesystem entry to check for
+        s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        s.settimeout(0.2)
+        try:
+            s.connect(sock_path)
+            return True
+        except OSError:
+            return False
+        finally:
+            s.close()
+
     def _get_socket_path(self):
-        # Wait for socket to be created and return its path
+        # Wait for the daemon to accept connections and return its
+        # socket path. On Linux the daemon listens on the abstract
+        # \0vidurai-{user} socket, so discovery is connect-based; on
+        # other Unix we look for the .sock file under our TMPDIR.
         for _ in range(50):
-            if os.path.exists(self.temp_dir):
-                for f in os.listdir(self.temp_dir):
-                    if f.endswith(".sock"):
-                        return os.path.join(self.temp_dir, f)
+            if sys.platform == 'linux':
+                candidates = [get_pipe_path()]
+            elif os.path.exists(self.temp_dir):
+                candidates = [os.path.join(self.temp_dir, f)
+                              for f in os.listdir(self.temp_dir)
+                              if f.endswith(".sock")]
+            else:
+                candidates = []
+            for sock_path in candidates:
+                if self._daemon_listening(sock_path):
+                    return sock_path
             time.sleep(0.1)
         log_path = os.path.join(self.vidurai_dir, "vidurai.log")
         log_content = open(log_path).read() if os.path.exists(log_path) else "No log file"
@@ -112,8 +137,8 @@ class TestBaselineJourney:
         assert start_res.returncode == 0, f"Daemon failed to start: {start_res.stderr}"
         
         sock_path = self._get_socket_path()
-        assert os.path.exists(sock_path)
-        
+        assert self._daemon_listening(sock_path)
+
         pid_file = os.path.join(self.vidurai_dir, "daemon.pid")
         assert os.path.exists(pid_file)
         
@@ -226,7 +251,7 @@ class TestBaselineJourney:
         # Stage E - Restart persistence
         subprocess.run([sys.executable, "-m", "vidurai.cli", "stop"], env=self.env, check=True)
         assert not os.path.exists(pid_file)
-        assert not os.path.exists(sock_path)
+        assert not self._daemon_listening(sock_path)
         
         subprocess.run([sys.executable, "-m", "vidurai.cli", "start"], env=self.env, check=True)
         sock_path = self._get_socket_path()
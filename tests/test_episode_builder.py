@@ -447,6 +447,66 @@ def test_episode_serialization():
     print("✅ PASSED: Episode serialization works\n")
 
 
+def test_bulk_event_handling():
+    """Test handle_events_bulk processes a batch like sequential handle_event"""
+    print("=" * 70)
+    print("🧪 TEST 9: Bulk Event Handling")
+    print("=" * 70)
+    print()
+
+    from vidurai.core.episode_builder import EpisodeBuilder
+    from vidurai.core.event_bus import ViduraiEvent
+
+    events = [
+        ViduraiEvent(
+            type="memory.created",
+            source="vismriti",
+            project_path="/test/bulk",
+            payload={"gist": "Fixed bug in auth.py", "memory_type": "bugfix", "file_path": "auth.py"}
+        ),
+        ViduraiEvent(
+            type="cli.context",
+            source="cli",
+            project_path="/test/bulk",
+            payload={"query": "auth bug", "memory_count": 3}
+        ),
+        ViduraiEvent(
+            type="memory.created",
+            source="vismriti",
+            project_path="/test/bulk",
+            payload={"gist": "Added regression test", "file_path": "test_auth.py"}
+        ),
+    ]
+
+    # Bulk path
+    bulk_builder = EpisodeBuilder(inactivity_timeout_minutes=5)
+    bulk_builder.handle_events_bulk(events)
+
+    # Sequential path for comparison
+    seq_builder = EpisodeBuilder(inactivity_timeout_minutes=5)
+    for event in events:
+        seq_builder.handle_event(event)
+
+    bulk_episode = bulk_builder.get_current_episode("/test/bulk")
+    seq_episode = seq_builder.get_current_episode("/test/bulk")
+
+    assert bulk_episode is not None, "Bulk load should create an episode"
+    assert bulk_episode.event_count == 3, "Episode should have all 3 events"
+    assert bulk_episode.event_count == seq_episode.event_count
+    assert bulk_episode.episode_type == seq_episode.episode_type == "bugfix"
+    assert bulk_episode.file_paths == seq_episode.file_paths
+    print(f"✅ Bulk episode matches sequential: {bulk_episode}")
+    print()
+
+    # Empty batch is a no-op
+    bulk_builder.handle_events_bulk([])
+    assert bulk_builder.get_current_episode("/test/bulk").event_count == 3
+    print("✅ Empty batch is a no-op")
+    print()
+
+    print("✅ PASSED: Bulk event handling works\n")
+
+
 if __name__ == "__main__":
     try:
         print()
@@ -461,6 +521,7 @@ if __name__ == "__main__":
         test_episode_metadata()
         test_episode_statistics()
         test_episode_serialization()
+        test_bulk_event_handling()
 
         print()
         print("=" * 70)
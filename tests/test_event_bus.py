@@ -7,6 +7,7 @@ Tests the local telemetry core for Vidurai
 import sys
 import time
 import threading
+import itertools
 from pathlib import Path
 from datetime import datetime
 
@@ -159,19 +160,20 @@ def test_thread_safety():
 
     EventBus.reset()
 
-    # Track events
-    received_events = []
-    lock = threading.Lock()
+    num_threads = 10
+    events_per_thread = 50
+
+    # Preallocate the event slots — avoids list-resize churn under load.
+    # next(count) is atomic in CPython, so no lock is needed in the handler.
+    received_events = [None] * (num_threads * events_per_thread)
+    idx = itertools.count()
 
     def handler(event: ViduraiEvent):
-        with lock:
-            received_events.append(event)
+        received_events[next(idx)] = event
 
     EventBus.subscribe(handler)
 
     # Publish from multiple threads
-    num_threads = 10
-    events_per_thread = 50
     threads = []
 
     def publish_events(thread_id):
@@ -194,12 +196,15 @@ def test_thread_safety():
         t.join()
 
     total_expected = num_threads * events_per_thread
+    received_count = next(idx)
     print(f"✅ All threads completed")
-    print(f"✅ Expected {total_expected} events, received {len(received_events)}")
+    print(f"✅ Expected {total_expected} events, received {received_count}")
 
-    # Verify all events received
-    assert len(received_events) == total_expected, \
+    # Verify all events received (every preallocated slot filled)
+    assert received_count == total_expected, \
         f"Should receive all {total_expected} events"
+    assert all(event is not None for event in received_events), \
+        "No slot should be left unfilled"
     print("✅ All events received (no race conditions)")
 
     # Verify no corruption (each event has valid data)
@@ -369,6 +374,42 @@ def test_statistics():
     print("\n✅ PASSED: Statistics work correctly\n")
 
 
+def test_capture_context_manager():
+    """Test EventBus.capture() snapshotting helper"""
+    print("=" * 70)
+    print("🧪 TEST 10: Capture Context Manager")
+    print("=" * 70)
+    print()
+
+    from vidurai.core.event_bus import EventBus, ViduraiEvent
+
+    EventBus.reset()
+
+    # Capture with a type filter
+    with EventBus.capture("terminal.") as events:
+        EventBus.publish(ViduraiEvent(type="terminal.command", source="test"))
+        EventBus.publish(ViduraiEvent(type="ai.user_message", source="test"))
+        EventBus.publish(ViduraiEvent(type="terminal.error", source="test"))
+
+    assert len(events) == 2, "Filter should capture only terminal.* events"
+    assert events[0].type == "terminal.command"
+    assert events[1].type == "terminal.error"
+    print("✅ Type filter captured matching events in order")
+
+    # Handler is removed on exit
+    EventBus.publish(ViduraiEvent(type="terminal.command", source="test"))
+    assert len(events) == 2, "Should not capture after with-block exits"
+    print("✅ Capture handler unsubscribed on exit")
+
+    # Capture without filter sees everything
+    with EventBus.capture() as all_events:
+        EventBus.publish(ViduraiEvent(type="editor.file_save", source="test"))
+    assert len(all_events) == 1
+    print("✅ Unfiltered capture sees all events")
+
+    print("\n✅ PASSED: Capture context manager works\n")
+
+
 def test_error_handling():
     """Test that handler errors don't break event bus"""
     print("=" * 70)
@@ -419,6 +460,7 @@ if __name__ == "__main__":
         test_event_filtering()
         test_convenience_function()
         test_statistics()
+        test_capture_context_manager()
         test_error_handling()
 
         print()
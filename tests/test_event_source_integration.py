@@ -28,14 +28,6 @@ def test_vismriti_memory_events():
     # Reset EventBus
     EventBus.reset()
 
-    # Track received events
-    received_events: List[ViduraiEvent] = []
-
-    def event_handler(event: ViduraiEvent):
-        received_events.append(event)
-
-    EventBus.subscribe(event_handler)
-
     # Create temp directory
     temp_dir = tempfile.mkdtemp()
     try:
@@ -46,13 +38,14 @@ def test_vismriti_memory_events():
             enable_gist_extraction=False
         )
 
-        memory.remember(
-            "Fixed authentication bug in auth.py",
-            metadata={"type": "bugfix", "file": "auth.py", "line": 42}
-        )
+        with EventBus.capture("memory.") as events:
+            memory.remember(
+                "Fixed authentication bug in auth.py",
+                metadata={"type": "bugfix", "file": "auth.py", "line": 42}
+            )
 
         # Find memory.created event
-        created_events = [e for e in received_events if e.type == "memory.created"]
+        created_events = [e for e in events if e.type == "memory.created"]
         assert len(created_events) >= 1, "Should have at least 1 memory.created event"
 
         event = created_events[0]
@@ -67,12 +60,12 @@ def test_vismriti_memory_events():
 
         # Test 1.2: Context retrieval publishes event
         print("Test 1.2: memory.context_retrieved event")
-        received_events.clear()
 
-        context = memory.get_context_for_ai(query="auth", max_tokens=1000)
+        with EventBus.capture("memory.") as events:
+            context = memory.get_context_for_ai(query="auth", max_tokens=1000)
 
         # Find memory.context_retrieved event
-        context_events = [e for e in received_events if e.type == "memory.context_retrieved"]
+        context_events = [e for e in events if e.type == "memory.context_retrieved"]
         assert len(context_events) >= 1, "Should have at least 1 memory.context_retrieved event"
 
         event = context_events[0]
@@ -106,14 +99,6 @@ def test_cli_events():
     # Reset EventBus
     EventBus.reset()
 
-    # Track received events
-    received_events: List[ViduraiEvent] = []
-
-    def event_handler(event: ViduraiEvent):
-        received_events.append(event)
-
-    EventBus.subscribe(event_handler)
-
     # Create temp directory with test data
     temp_dir = tempfile.mkdtemp()
     try:
@@ -123,21 +108,21 @@ def test_cli_events():
             "Fixed critical authentication bug",
             metadata={"type": "bugfix", "file": "auth.py"}
         )
-        received_events.clear()  # Clear creation event
 
         # Test 2.1: CLI recall publishes event
         print("Test 2.1: cli.recall event")
         runner = CliRunner()
-        result = runner.invoke(recall, [
-            '--project', temp_dir,
-            '--query', 'authentication',
-            '--min-salience', 'LOW'
-        ])
+        with EventBus.capture("cli.") as events:
+            result = runner.invoke(recall, [
+                '--project', temp_dir,
+                '--query', 'authentication',
+                '--min-salience', 'LOW'
+            ])
 
         assert result.exit_code == 0, f"CLI recall failed: {result.output}"
 
         # Find cli.recall event
-        recall_events = [e for e in received_events if e.type == "cli.recall"]
+        recall_events = [e for e in events if e.type == "cli.recall"]
         assert len(recall_events) >= 1, "Should have at least 1 cli.recall event"
 
         event = recall_events[0]
@@ -150,17 +135,17 @@ def test_cli_events():
 
         # Test 2.2: CLI context publishes event
         print("Test 2.2: cli.context event")
-        received_events.clear()
 
-        result = runner.invoke(context, [
-            '--project', temp_dir,
-            '--query', 'auth'
-        ])
+        with EventBus.capture("cli.") as events:
+            result = runner.invoke(context, [
+                '--project', temp_dir,
+                '--query', 'auth'
+            ])
 
         assert result.exit_code == 0, f"CLI context failed: {result.output}"
 
         # Find cli.context event
-        context_events = [e for e in received_events if e.type == "cli.context"]
+        context_events = [e for e in events if e.type == "cli.context"]
         assert len(context_events) >= 1, "Should have at least 1 cli.context event"
 
         event = context_events[0]
@@ -191,18 +176,10 @@ def test_mcp_server_events():
     # Reset EventBus
     EventBus.reset()
 
-    # Track received events
-    received_events: List[ViduraiEvent] = []
-
-    def event_handler(event: ViduraiEvent):
-        received_events.append(event)
-
-    EventBus.subscribe(event_handler)
-
     # Create temp directory with test data
     temp_dir = tempfile.mkdtemp()
     try:
-        # Create test memory (WITHOUT clearing events yet - we need the handler subscribed)
+        # Create test memory
         memory = VismritiMemory(project_path=temp_dir, enable_gist_extraction=False)
         memory.remember(
             "Implemented OAuth2 authentication in auth module",
@@ -212,27 +189,21 @@ def test_mcp_server_events():
         # Test 3.1: MCP server uses VismritiMemory.get_context_for_ai, which publishes events
         print("Test 3.1: MCP context integration (via VismritiMemory)")
 
-        # Clear events after creation (keep handler subscribed)
-        received_events.clear()
-
-        # Verify handler is still subscribed
-        stats = EventBus.get_statistics()
-        print(f"Debug: EventBus has {stats['handler_count']} handlers")
-
         # Simulate MCP server call - MCP internally calls VismritiMemory.get_context_for_ai
         # Use None for query to get all memories
-        result = memory.get_context_for_ai(query=None, max_tokens=1000)
+        with EventBus.capture("memory.") as events:
+            result = memory.get_context_for_ai(query=None, max_tokens=1000)
 
         assert isinstance(result, str), "get_context_for_ai should return string"
 
         # Debug: print all received events
-        print(f"Debug: Received {len(received_events)} events:")
-        for e in received_events:
+        print(f"Debug: Received {len(events)} events:")
+        for e in events:
             print(f"  - {e.type} from {e.source}")
 
         # Find memory.context_retrieved event (published by VismritiMemory)
-        context_events = [e for e in received_events if e.type == "memory.context_retrieved"]
-        assert len(context_events) >= 1, f"Should have at least 1 memory.context_retrieved event, got {len(received_events)} events total"
+        context_events = [e for e in events if e.type == "memory.context_retrieved"]
+        assert len(context_events) >= 1, f"Should have at least 1 memory.context_retrieved event, got {len(events)} events total"
 
         event = context_events[0]
         assert event.source == "vismriti"
@@ -1,155 +1,156 @@
 #!/usr/bin/env python3
 """
 Vidurai MCP Server Live Test
-Tests the HTTP-based MCP server endpoints
+Tests the HTTP-based MCP server endpoints against an in-process server
 """
+import os
+import re
+import signal
 import subprocess
+import sys
+import threading
 import time
+
+import pytest
 import requests
-import sys
-import os
-import signal
 
-# CONFIG - Match mcp_server.py defaults
-PORT = 8765
-BASE_URL = f"http://localhost:{PORT}"
-PROJECT_PATH = os.getcwd()
+from vidurai.mcp_server import create_server
 
-def log(msg, level="INFO"):
-    colors = {"INFO": "\033[96m", "OK": "\033[92m", "FAIL": "\033[91m", "WARN": "\033[93m"}
-    print(f"{colors.get(level, '')}{msg}\033[0m")
+PROJECT_PATH = os.getcwd()
 
-def test_mcp_server():
-    """Test the MCP server lifecycle"""
 
-    # 1. START SERVER
-    log("🚀 Starting Vidurai MCP Server...")
+@pytest.fixture(scope="module")
+def http():
+    """Shared keep-alive session — one TCP connection across all tests"""
+    with requests.Session() as session:
+        yield session
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    """Run the MCP server in-process on an ephemeral port"""
+    server = create_server(port=0, allow_all_origins=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    host, port = server.server_address[:2]
+    yield f"http://{host}:{port}"
+
+    server.shutdown()
+    thread.join(timeout=5)
+
+
+def test_health(base_url, http):
+    resp = http.get(f"{base_url}/health", timeout=5)
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data['status'] == 'ok'
+    assert data['server'] == 'vidurai-mcp'
+
+
+def test_capabilities(base_url, http):
+    resp = http.get(f"{base_url}/capabilities", timeout=5)
+    assert resp.status_code == 200
+    tools = [t['name'] for t in resp.json().get('tools', [])]
+    assert 'get_project_context' in tools
+    assert 'search_memories' in tools
+    assert 'get_recent_activity' in tools
+    assert 'get_active_project' in tools
+
+
+def test_get_active_project(base_url, http):
+    resp = http.post(f"{base_url}/", json={
+        "tool": "get_active_project",
+        "params": {}
+    }, timeout=5)
+    assert resp.status_code == 200
+    assert 'result' in resp.json()
+
+
+def test_search_memories(base_url, http):
+    resp = http.post(f"{base_url}/", json={
+        "tool": "search_memories",
+        "params": {
+            "project": PROJECT_PATH,
+            "query": "test",
+            "limit": 5
+        }
+    }, timeout=10)
+    assert resp.status_code == 200
+    data = resp.json()
+    assert 'count' in data or 'error' in data
+
+
+def test_get_project_context(base_url, http):
+    resp = http.post(f"{base_url}/", json={
+        "tool": "get_project_context",
+        "params": {
+            "project": PROJECT_PATH,
+            "query": "architecture",
+            "max_tokens": 500
+        }
+    }, timeout=10)
+    assert resp.status_code == 200
+    assert 'result' in resp.json()
+
+
+def test_get_recent_activity(base_url, http):
+    resp = http.post(f"{base_url}/", json={
+        "tool": "get_recent_activity",
+        "params": {
+            "project": PROJECT_PATH,
+            "hours": 24
+        }
+    }, timeout=10)
+    assert resp.status_code == 200
+    data = resp.json()
+    assert 'count' in data or 'error' in data
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(
+    not os.environ.get("VIDURAI_RUN_SLOW_TESTS"),
+    reason="subprocess smoke test; set VIDURAI_RUN_SLOW_TESTS=1 to run"
+)
+def test_subprocess_smoke():
+    """Smoke test the real `python -m vidurai.mcp_server` entry point"""
+    # Ephemeral port so parallel CI runs don't collide on 8765
     process = subprocess.Popen(
-        [sys.executable, "-m", "vidurai.mcp_server", "--allow-all-origins"],
+        [sys.executable, "-m", "vidurai.mcp_server", "--allow-all-origins", "--port", "0"],
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
+        text=True,
         env={**os.environ, "PYTHONUNBUFFERED": "1"}
     )
-
     try:
-        # Give server time to start
-        time.sleep(3)
-
-        # Check if process is still running
-        if process.poll() is not None:
-            stdout, stderr = process.communicate()
-            log(f"❌ Server failed to start: {stderr.decode()}", "FAIL")
-            return 1
-
-        # 2. HEALTH CHECK
-        log("\n💓 Testing /health endpoint...")
-        try:
-            resp = requests.get(f"{BASE_URL}/health", timeout=5)
-            if resp.status_code == 200:
-                data = resp.json()
-                log(f"   ✅ Health OK: {data}", "OK")
-            else:
-                log(f"   ❌ Health check failed: {resp.status_code}", "FAIL")
-                return 1
-        except Exception as e:
-            log(f"   ❌ Connection failed: {e}", "FAIL")
-            return 1
-
-        # 3. CAPABILITIES
-        log("\n📋 Testing /capabilities endpoint...")
-        resp = requests.get(f"{BASE_URL}/capabilities", timeout=5)
-        if resp.status_code == 200:
-            caps = resp.json()
-            tools = [t['name'] for t in caps.get('tools', [])]
-            log(f"   ✅ Tools available: {tools}", "OK")
-        else:
-            log(f"   ❌ Capabilities failed: {resp.status_code}", "FAIL")
-
-        # 4. TEST get_active_project
-        log("\n📂 Testing get_active_project tool...")
-        resp = requests.post(f"{BASE_URL}/", json={
-            "tool": "get_active_project",
-            "params": {}
-        }, timeout=5)
-        if resp.status_code == 200:
-            data = resp.json()
-            log(f"   ✅ Active project: {data.get('result', 'unknown')}", "OK")
-        else:
-            log(f"   ⚠️ get_active_project: {resp.status_code}", "WARN")
-
-        # 5. TEST search_memories
-        log("\n🔍 Testing search_memories tool...")
-        resp = requests.post(f"{BASE_URL}/", json={
-            "tool": "search_memories",
-            "params": {
-                "project": PROJECT_PATH,
-                "query": "test",
-                "limit": 5
-            }
-        }, timeout=10)
-        if resp.status_code == 200:
-            data = resp.json()
-            count = data.get('count', 0)
-            log(f"   ✅ Search returned {count} memories", "OK")
-        else:
-            log(f"   ⚠️ search_memories: {resp.status_code}", "WARN")
-
-        # 6. TEST get_project_context
-        log("\n🧠 Testing get_project_context tool...")
-        resp = requests.post(f"{BASE_URL}/", json={
-            "tool": "get_project_context",
-            "params": {
-                "project": PROJECT_PATH,
-                "query": "architecture",
-                "max_tokens": 500
-            }
-        }, timeout=10)
-        if resp.status_code == 200:
-            data = resp.json()
-            result = data.get('result', '')
-            log(f"   ✅ Context length: {len(result)} chars", "OK")
-            if result and len(result) > 50:
-                log(f"   📝 Preview: {result[:100]}...", "INFO")
-        else:
-            log(f"   ⚠️ get_project_context: {resp.status_code}", "WARN")
-
-        # 7. TEST get_recent_activity
-        log("\n⏰ Testing get_recent_activity tool...")
-        resp = requests.post(f"{BASE_URL}/", json={
-            "tool": "get_recent_activity",
-            "params": {
-                "project": PROJECT_PATH,
-                "hours": 24
-            }
-        }, timeout=10)
-        if resp.status_code == 200:
-            data = resp.json()
-            count = data.get('count', 0)
-            log(f"   ✅ Recent activity: {count} events", "OK")
-        else:
-            log(f"   ⚠️ get_recent_activity: {resp.status_code}", "WARN")
-
-        log("\n" + "="*50)
-        log("✅ MCP SERVER TEST PASSED", "OK")
-        log("="*50)
-        return 0
-
-    except Exception as e:
-        log(f"\n❌ FATAL ERROR: {e}", "FAIL")
-        import traceback
-        traceback.print_exc()
-        return 1
-
+        # The startup banner logs the actual bound port
+        port = None
+        for line in process.stderr:
+            match = re.search(r"Listening on: http://\S+?:(\d+)", line)
+            if match:
+                port = int(match.group(1))
+                break
+        assert port, "Server never reported its listening port"
+
+        # Poll /health with exponential backoff instead of a fixed sleep
+        deadline = time.monotonic() + 5
+        interval = 0.025
+        resp = None
+        while time.monotonic() < deadline:
+            assert process.poll() is None, "Server process exited during startup"
+            try:
+                resp = requests.get(f"http://localhost:{port}/health", timeout=0.2)
+                if resp.status_code == 200:
+                    break
+            except requests.ConnectionError:
+                pass
+            time.sleep(interval)
+            interval = min(interval * 2, 0.5)
+
+        assert resp is not None and resp.status_code == 200
     finally:
-        # CLEANUP
-        log("\n🛑 Stopping MCP Server...")
         try:
             os.kill(process.pid, signal.SIGTERM)
             process.wait(timeout=5)
-            log("   Server stopped cleanly", "OK")
-        except:
+        except Exception:
             process.kill()
-            log("   Server force-killed", "WARN")
-
-if __name__ == "__main__":
-    sys.exit(test_mcp_server())
@@ -12,14 +12,16 @@ from vidurai.core.memory_role_classifier import (
 )
 
 
+@pytest.fixture(scope="module")
+def classifier():
+    """One classifier per module — patterns compile once, not per test"""
+    return MemoryRoleClassifier()
+
+
 class TestMemoryRoleClassifier:
     """Test memory role classification"""
 
-    def setup_method(self):
-        """Setup classifier for each test"""
-        self.classifier = MemoryRoleClassifier()
-
-    def test_resolution_classification(self):
+    def test_resolution_classification(self, classifier):
         """Test detection of RESOLUTION memories"""
         # Test cases with resolution keywords
         test_cases = [
@@ -30,12 +32,12 @@ class TestMemoryRoleClassifier:
         ]
 
         for text in test_cases:
-            result = self.classifier.classify(text)
+            result = classifier.classify(text)
             assert result.role == MemoryRole.RESOLUTION, f"Failed to detect resolution in: {text}"
             assert result.confidence >= 0.7, f"Low confidence for resolution: {result.confidence}"
             assert len(result.keywords_matched) > 0, "No keywords matched"
 
-    def test_cause_classification(self):
+    def test_cause_classification(self, classifier):
         """Test detection of CAUSE memories"""
         test_cases = [
             "Root cause was JWT timestamp mismatch.",
@@ -45,12 +47,12 @@ class TestMemoryRoleClassifier:
         ]
 
         for text in test_cases:
-            result = self.classifier.classify(text)
+            result = classifier.classify(text)
             assert result.role == MemoryRole.CAUSE, f"Failed to detect cause in: {text}"
             assert result.confidence >= 0.7
             assert len(result.keywords_matched) > 0
 
-    def test_attempted_fix_classification(self):
+    def test_attempted_fix_classification(self, classifier):
         """Test detection of ATTEMPTED_FIX memories"""
         test_cases = [
             "Tried adding timezone info but still failing.",
@@ -59,18 +61,18 @@ class TestMemoryRoleClassifier:
         ]
 
         for text in test_cases:
-            result = self.classifier.classify(text)
+            result = classifier.classify(text)
             assert result.role == MemoryRole.ATTEMPTED_FIX, f"Failed to detect attempted fix in: {text}"
             assert result.confidence >= 0.6
 
         # Edge case: "Maybe the issue is" could be CAUSE or ATTEMPTED_FIX
         # Both are semantically valid - it's hypothesizing about the cause
         edge_case = "Maybe the issue is in the validation logic?"
-        result = self.classifier.classify(edge_case)
+        result = classifier.classify(edge_case)
         assert result.role in [MemoryRole.CAUSE, MemoryRole.ATTEMPTED_FIX], \
             f"Should be CAUSE or ATTEMPTED_FIX, got {result.role}"
 
-    def test_context_classification(self):
+    def test_context_classification(self, classifier):
         """Test detection of CONTEXT memories"""
         test_cases = [
             "For context: this auth system uses JWT tokens.",
@@ -80,10 +82,10 @@ class TestMemoryRoleClassifier:
         ]
 
         for text in test_cases:
-            result = self.classifier.classify(text)
+            result = classifier.classify(text)
             assert result.role == MemoryRole.CONTEXT, f"Failed to detect context in: {text}"
 
-    def test_noise_classification(self):
+    def test_noise_classification(self, classifier):
         """Test detection of NOISE memories"""
         test_cases = [
             "ok",
@@ -94,10 +96,10 @@ class TestMemoryRoleClassifier:
         ]
 
         for text in test_cases:
-            result = self.classifier.classify(text)
+            result = classifier.classify(text)
             assert result.role == MemoryRole.NOISE, f"Failed to detect noise in: {text}"
 
-    def test_priority_scoring(self):
+    def test_priority_scoring(self, classifier):
         """Test priority scores for different roles"""
         priorities = {
             MemoryRole.RESOLUTION: 20,
@@ -108,11 +110,11 @@ class TestMemoryRoleClassifier:
         }
 
         for role, expected_priority in priorities.items():
-            actual_priority = self.classifier.get_role_priority(role)
+            actual_priority = classifier.get_role_priority(role)
             assert actual_priority == expected_priority, \
                 f"{role.value} priority mismatch: expected {expected_priority}, got {actual_priority}"
 
-    def test_confidence_levels(self):
+    def test_confidence_levels(self, classifier):
         """Test confidence scores are within valid range"""
         test_texts = [
             "Fixed the bug completely.",
@@ -123,11 +125,11 @@ class TestMemoryRoleClassifier:
         ]
 
         for text in test_texts:
-            result = self.classifier.classify(text)
+            result = classifier.classify(text)
             assert 0.0 <= result.confidence <= 1.0, \
                 f"Invalid confidence: {result.confidence}"
 
-    def test_batch_classification(self):
+    def test_batch_classification(self, classifier):
         """Test batch processing of multiple memories"""
         memories = [
             {'id': 1, 'verbatim': 'Fixed the auth issue.', 'gist': None, 'metadata': None},
@@ -137,7 +139,7 @@ class TestMemoryRoleClassifier:
             {'id': 5, 'verbatim': 'ok', 'gist': None, 'metadata': None},
         ]
 
-        results = self.classifier.classify_batch(memories)
+        results = classifier.classify_batch(memories)
 
         assert len(results) == 5
         assert results[1].role == MemoryRole.RESOLUTION
@@ -146,10 +148,10 @@ class TestMemoryRoleClassifier:
         assert results[4].role == MemoryRole.CONTEXT
         assert results[5].role == MemoryRole.NOISE
 
-    def test_gist_metadata_usage(self):
+    def test_gist_metadata_usage(self, classifier):
         """Test that gist and metadata are used in classification"""
         # Verbatim is vague, but gist has clear resolution
-        result = self.classifier.classify(
+        result = classifier.classify(
             verbatim="Made some changes to the code.",
             gist="Fixed the authentication bug completely.",
             metadata={'event_type': 'code_change'}
@@ -157,7 +159,7 @@ class TestMemoryRoleClassifier:
 
         assert result.role == MemoryRole.RESOLUTION
 
-    def test_convenience_function(self):
+    def test_convenience_function(self, classifier):
         """Test the convenience function"""
         result = classify_memory_role(
             "Root cause was missing timezone conversion."
@@ -166,9 +168,9 @@ class TestMemoryRoleClassifier:
         assert isinstance(result.role, MemoryRole)
         assert result.role == MemoryRole.CAUSE
 
-    def test_statistics(self):
+    def test_statistics(self, classifier):
         """Test classifier statistics"""
-        stats = self.classifier.get_statistics()
+        stats = classifier.get_statistics()
 
         assert stats['classifier'] == 'pattern_based'
         assert 'pattern_counts' in stats
@@ -180,41 +182,38 @@ class TestMemoryRoleClassifier:
 class TestRoleClassificationEdgeCases:
     """Test edge cases and corner scenarios"""
 
-    def setup_method(self):
-        self.classifier = MemoryRoleClassifier()
-
-    def test_empty_text(self):
+    def test_empty_text(self, classifier):
         """Test classification of empty text"""
-        result = self.classifier.classify("")
+        result = classifier.classify("")
         assert result.role == MemoryRole.NOISE
 
-    def test_very_long_text(self):
+    def test_very_long_text(self, classifier):
         """Test classification of very long text"""
         long_text = "This is a long debugging session. " * 100 + "Fixed the issue finally."
-        result = self.classifier.classify(long_text)
+        result = classifier.classify(long_text)
         assert result.role == MemoryRole.RESOLUTION  # Should still detect resolution
 
-    def test_mixed_signals(self):
+    def test_mixed_signals(self, classifier):
         """Test text with multiple role indicators"""
         # Has both cause and resolution keywords
         mixed = "Root cause was JWT issue. Fixed by normalizing timestamps."
-        result = self.classifier.classify(mixed)
+        result = classifier.classify(mixed)
 
         # Resolution should win (higher priority in pattern matching)
         assert result.role == MemoryRole.RESOLUTION
 
-    def test_ambiguous_text(self):
+    def test_ambiguous_text(self, classifier):
         """Test ambiguous text without clear role indicators"""
-        result = self.classifier.classify("Working on the authentication module.")
+        result = classifier.classify("Working on the authentication module.")
         # Should default to CONTEXT
         assert result.role == MemoryRole.CONTEXT
         assert result.confidence < 0.6  # Low confidence for ambiguous
 
-    def test_case_insensitivity(self):
+    def test_case_insensitivity(self, classifier):
         """Test that classification is case-insensitive"""
         results = []
         for text in ["FIXED THE BUG", "fixed the bug", "FiXeD tHe BuG"]:
-            result = self.classifier.classify(text)
+            result = classifier.classify(text)
             results.append(result.role)
 
         # All should be RESOLUTION
@@ -29,6 +29,7 @@ import time
 import asyncio
 import socket
 import getpass
+import itertools
 import tempfile
 from pathlib import Path
 from datetime import datetime
@@ -45,69 +46,181 @@ try:
 except ImportError:
     PYTEST_ASYNCIO_AVAILABLE = False
 
-# Check if daemon socket exists
-def _daemon_available():
-    """Check if daemon socket is available"""
+# orjson serializes/deserializes NDJSON frames several times faster
+# than stdlib json and works on bytes directly; fall back when absent
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def get_pipe_path() -> str:
+    """Get the platform-appropriate pipe path (must match daemon)"""
     uid = getpass.getuser()
     if sys.platform == 'win32':
-        return False  # Can't easily check Windows named pipes
+        return f"\\\\.\\pipe\\vidurai-{uid}"
+    elif sys.platform == 'linux':
+        # Abstract-namespace socket, mirrors daemon.ipc.get_pipe_path
+        return f"\0vidurai-{uid}"
     else:
-        sock_path = os.path.join(tempfile.gettempdir(), f"vidurai-{uid}.sock")
-        return os.path.exists(sock_path)
+        return os.path.join(tempfile.gettempdir(), f"vidurai-{uid}.sock")
 
-DAEMON_AVAILABLE = _daemon_available()
 
-# Combined skip condition
-SKIP_IPC_TESTS = not PYTEST_ASYNCIO_AVAILABLE or not DAEMON_AVAILABLE
-SKIP_REASON = (
-    "Skipped: requires pytest-asyncio and running daemon "
-    f"(pytest-asyncio={PYTEST_ASYNCIO_AVAILABLE}, daemon={DAEMON_AVAILABLE})"
-)
+# The platform never changes mid-run: resolve the path once at import
+# instead of re-branching on sys.platform per connect
+_PIPE_PATH = get_pipe_path()
 
-# Test subject identifier for cleanup
-TEST_SUBJECT = f"TEST_IPC_PHASE5_{int(datetime.now().timestamp())}"
 
+_daemon_probe = None
+
+
+def _daemon_available():
+    """Check if daemon socket is available (cached after first probe)
+
+    Probes with a real connect() rather than os.path.exists: abstract
+    namespace sockets (Linux) have no filesystem entry, and a leftover
+    .sock file from a crashed daemon would be a false positive anyway.
+    Runs lazily from the session fixture, not at import, so collecting
+    or deselecting these tests costs nothing.
+    """
+    global _daemon_probe
+    if _daemon_probe is not None:
+        return _daemon_probe
 
-def get_pipe_path() -> str:
-    """Get the platform-appropriate pipe path (must match daemon)"""
-    uid = getpass.getuser()
     if sys.platform == 'win32':
-        return f"\\\\.\\pipe\\vidurai-{uid}"
-    else:
-        return os.path.join(tempfile.gettempdir(), f"vidurai-{uid}.sock")
+        _daemon_probe = False  # Can't easily check Windows named pipes
+        return _daemon_probe
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(0.2)
+    try:
+        sock.connect(_PIPE_PATH)
+        _daemon_probe = True
+    except OSError:
+        _daemon_probe = False
+    finally:
+        sock.close()
+    return _daemon_probe
+
+
+# Import-time skip covers only what is knowable without syscalls; the
+# daemon probe happens in the ipc_client fixture when tests actually run
+SKIP_IPC_TESTS = not PYTEST_ASYNCIO_AVAILABLE
+SKIP_REASON = "Skipped: requires pytest-asyncio"
+
+# Test subject identifier for cleanup
+TEST_SUBJECT = f"TEST_IPC_PHASE5_{int(datetime.now().timestamp())}"
+
+# Distinguishes clients created in the same run — combined with a
+# per-client message counter this keeps msg_ids unique even when tests
+# share an event loop and fire within the same millisecond
+_CLIENT_SEQ = itertools.count(1)
+
+# Frame delimiter, encoded once — paired with writelines() so the
+# payload bytes never get copied into a concatenated line
+_NEWLINE = b"\n"
+
+
+class _NDJSONProtocol(asyncio.BufferedProtocol):
+    """NDJSON framing over a preallocated receive buffer
+
+    BufferedProtocol lets the event loop recv() straight into our
+    bytearray instead of allocating a bytes object per read and
+    scanning for newlines at Python level through StreamReader.
+    Complete frames (without the trailing newline) are handed to
+    on_frame; on_close fires when the connection drops.
+    """
+
+    INITIAL_BUFFER_SIZE = 65536
+
+    def __init__(self, on_frame, on_close):
+        self._buf = bytearray(self.INITIAL_BUFFER_SIZE)
+        self._view = memoryview(self._buf)
+        self._filled = 0  # bytes of valid data in _buf
+        self._on_frame = on_frame
+        self._on_close = on_close
+
+    def get_buffer(self, sizehint):
+        if self._filled == len(self._buf):
+            # Frame larger than the buffer — swap in a bigger one
+            # (resizing in place would fail while views are exported)
+            grown = bytearray(len(self._buf) * 2)
+            grown[:self._filled] = self._buf[:self._filled]
+            self._buf = grown
+            self._view = memoryview(self._buf)
+        return self._view[self._filled:]
+
+    def buffer_updated(self, nbytes):
+        scan_from = self._filled
+        end = self._filled + nbytes
+        start = 0
+        while True:
+            nl = self._buf.find(b'\n', max(start, scan_from), end)
+            if nl == -1:
+                break
+            if nl > start:
+                self._on_frame(bytes(self._buf[start:nl]))
+            start = nl + 1
+        if start:
+            # Shift any partial frame to the front of the buffer
+            self._buf[:end - start] = self._buf[start:end]
+            end -= start
+        self._filled = end
+
+    def connection_lost(self, exc):
+        self._on_close()
 
 
 class IPCTestClient:
     """Simple IPC client for testing"""
 
     def __init__(self):
-        self.pipe_path = get_pipe_path()
-        self.reader = None
-        self.writer = None
+        self.pipe_path = _PIPE_PATH
+        self.transport = None
         self.connected = False
+        self.subject = f"{TEST_SUBJECT}_c{next(_CLIENT_SEQ)}"
+        self._msg_seq = itertools.count(1)
+        # Static id prefix computed once; frames queued in one batch
+        # share a single clock sample (see send_nowait/flush)
+        self._id_prefix = f"{self.subject}_"
+        self._batch_ts = None
+        # Wire timestamps are derived from the monotonic clock against
+        # a wall-clock base sampled once at connect — one gettimeofday
+        # per connection instead of one per frame
+        self._wall_base_ms = 0
+        self._mono_base_ns = 0
+        # Serializes writes on the shared connection so concurrent
+        # tests can't interleave NDJSON frames
+        self._send_lock = asyncio.Lock()
+        # Responses are matched to requests by message id, so multiple
+        # sends can be in flight without head-of-line blocking
+        self._pending: dict = {}
 
     async def connect(self, timeout: float = 5.0) -> bool:
         """Connect to daemon IPC server"""
+        if sys.platform == 'win32':
+            # Named-pipe transport isn't wired up in this harness
+            print("✗ Windows named pipes not supported by the test client")
+            return False
         try:
-            if sys.platform == 'win32':
-                # Windows Named Pipe
-                self.reader, self.writer = await asyncio.wait_for(
-                    asyncio.open_connection(path=self.pipe_path),
-                    timeout=timeout
-                )
-            else:
-                # Unix Socket
-                self.reader, self.writer = await asyncio.wait_for(
-                    asyncio.open_unix_connection(path=self.pipe_path),
-                    timeout=timeout
-                )
+            loop = asyncio.get_event_loop()
+            self.transport, _ = await asyncio.wait_for(
+                loop.create_unix_connection(
+                    lambda: _NDJSONProtocol(self._dispatch_frame,
+                                            self._connection_lost),
+                    path=self.pipe_path
+                ),
+                timeout=timeout
+            )
+            self._wall_base_ms = time.time_ns() // 1_000_000
+            self._mono_base_ns = time.monotonic_ns()
             self.connected = True
             print(f"✓ Connected to daemon at {self.pipe_path}")
             return True
         except asyncio.TimeoutError:
             print(f"✗ Connection timeout (is daemon running?)")
             return False
-        except FileNotFoundError:
+        except (FileNotFoundError, ConnectionRefusedError):
             print(f"✗ Socket not found: {self.pipe_path}")
             print("  Start daemon with: python -m vidurai.daemon")
             return False
@@ -115,268 +228,231 @@ class IPCTestClient:
             print(f"✗ Connection error: {e}")
             return False
 
+    def _dispatch_frame(self, frame: bytes):
+        """Match an incoming frame to the pending future with its id
+
+        Unmatched frames (heartbeats, broadcasts) are dropped.
+        """
+        try:
+            msg = orjson.loads(frame) if ORJSON_AVAILABLE else json.loads(frame)
+        except ValueError:
+            return
+        future = self._pending.pop(msg.get("id"), None)
+        if future and not future.done():
+            future.set_result(msg)
+
+    def _connection_lost(self):
+        """Connection gone — fail anything still waiting"""
+        for future in self._pending.values():
+            if not future.done():
+                future.set_result({"ok": False, "error": "Connection closed"})
+        self._pending.clear()
+        self.connected = False
+
     async def disconnect(self):
         """Disconnect from daemon"""
-        if self.writer:
-            self.writer.close()
-            try:
-                await self.writer.wait_closed()
-            except:
-                pass
+        if self.transport:
+            self.transport.close()
+            self.transport = None
         self.connected = False
 
-    async def send(self, msg_type: str, data: dict = None, timeout: float = 5.0) -> dict:
-        """Send message and wait for response"""
+    def _now_ms(self) -> int:
+        """Millisecond wall time via the monotonic clock"""
+        return self._wall_base_ms + (time.monotonic_ns() - self._mono_base_ns) // 1_000_000
+
+    def _queue_message(self, msg_type: str, data: dict = None, ts: int = None):
+        """Frame a message and hand it to the transport
+
+        Returns (msg_id, future); the future resolves when the demux
+        sees the matching response.
+        """
         if not self.connected:
             raise RuntimeError("Not connected")
 
-        msg_id = f"{TEST_SUBJECT}_{int(time.time() * 1000)}"
+        msg_id = self._id_prefix + str(next(self._msg_seq))
 
         message = {
             "v": 1,
             "type": msg_type,
-            "ts": int(time.time() * 1000),
+            "ts": ts if ts is not None else self._now_ms(),
             "id": msg_id,
             "data": data or {}
         }
 
-        # Send NDJSON
-        line = json.dumps(message) + "\n"
-        self.writer.write(line.encode('utf-8'))
-        await self.writer.drain()
-
-        # Read response
-        try:
-            response_line = await asyncio.wait_for(
-                self.reader.readline(),
-                timeout=timeout
-            )
-            if not response_line:
-                return {"ok": False, "error": "No response"}
-
-            return json.loads(response_line.decode('utf-8'))
-        except asyncio.TimeoutError:
-            return {"ok": False, "error": "Response timeout"}
-        except json.JSONDecodeError as e:
-            return {"ok": False, "error": f"Invalid JSON: {e}"}
-
-
-@pytest.mark.skipif(SKIP_IPC_TESTS, reason=SKIP_REASON)
-@pytest.mark.asyncio
-async def test_ping_pong():
-    """Test basic connectivity with ping/pong"""
-    print("\n=== Test: Ping/Pong ===")
-
-    client = IPCTestClient()
-    try:
-        if not await client.connect():
-            return False
-
-        response = await client.send("ping")
-
-        if response.get("type") == "pong" and response.get("ok", True):
-            print("✓ Ping/Pong successful")
-            return True
-        else:
-            print(f"✗ Unexpected response: {response}")
-            return False
-    finally:
-        await client.disconnect()
-
-
-@pytest.mark.skipif(SKIP_IPC_TESTS, reason=SKIP_REASON)
-@pytest.mark.asyncio
-async def test_focus_event():
-    """Test focus event handling (StateLinker)"""
-    print("\n=== Test: Focus Event (StateLinker) ===")
-
-    client = IPCTestClient()
-    try:
-        if not await client.connect():
-            return False
-
-        # Send focus event with test data
-        test_file = f"/tmp/{TEST_SUBJECT}_test.py"
-        response = await client.send("focus", {
-            "file": test_file,
-            "line": 42,
-            "column": 10,
-            "selection": "def test_function():",
-            "project_root": "/tmp"
-        })
-
-        if response.get("ok"):
-            print(f"✓ Focus event accepted")
-            print(f"  - File: {response.get('data', {}).get('file', 'N/A')}")
-            print(f"  - Line: {response.get('data', {}).get('line', 'N/A')}")
-
-            # Note: The response may indicate accepted=False if file doesn't exist
-            # (Reality Grounding validation)
-            accepted = response.get('data', {}).get('accepted', False)
-            if not accepted:
-                print(f"  - Note: File validation failed (expected for test path)")
-            return True
-        else:
-            print(f"✗ Focus event failed: {response.get('error')}")
-            return False
-    finally:
-        await client.disconnect()
-
-
-@pytest.mark.skipif(SKIP_IPC_TESTS, reason=SKIP_REASON)
-@pytest.mark.asyncio
-async def test_get_focus():
-    """Test get_focus query (StateLinker)"""
-    print("\n=== Test: Get Focus State ===")
+        future = asyncio.get_event_loop().create_future()
+        self._pending[msg_id] = future
 
-    client = IPCTestClient()
-    try:
-        if not await client.connect():
-            return False
-
-        response = await client.send("get_focus", {})
-
-        if response.get("ok"):
-            data = response.get("data", {})
-            print(f"✓ Get focus successful")
-            print(f"  - Active file: {data.get('active_file', 'None')}")
-            print(f"  - Active line: {data.get('active_line', 'None')}")
-            print(f"  - Recent files: {len(data.get('recent_files', []))}")
-            print(f"  - Stats: {data.get('stats', {})}")
-            return True
+        # Send NDJSON (orjson emits bytes, skipping the encode);
+        # writelines hands both slices to the transport without
+        # building an intermediate payload+newline bytes object
+        if ORJSON_AVAILABLE:
+            payload = orjson.dumps(message)
         else:
-            error = response.get("error", "Unknown error")
-            # StateLinker not initialized is expected if daemon just started
-            if "StateLinker not initialized" in error:
-                print(f"⚠ StateLinker not ready yet (expected on fresh daemon)")
-                return True
-            print(f"✗ Get focus failed: {error}")
-            return False
-    finally:
-        await client.disconnect()
-
-
-@pytest.mark.skipif(SKIP_IPC_TESTS, reason=SKIP_REASON)
-@pytest.mark.asyncio
-async def test_terminal_event():
-    """Test terminal event handling (Reality Check)"""
-    print("\n=== Test: Terminal Event (Reality Check) ===")
+            payload = json.dumps(message).encode('utf-8')
+        self.transport.writelines((payload, _NEWLINE))
 
-    client = IPCTestClient()
-    try:
-        if not await client.connect():
-            return False
+        return msg_id, future
 
-        # Send terminal event with test data
-        response = await client.send("terminal", {
-            "cmd": f"echo {TEST_SUBJECT}",
-            "code": 0,
-            "out": f"Output from {TEST_SUBJECT}",
-            "err": "",
-            "dur": 100
-        })
-
-        if response.get("ok") or response.get("type") == "ack":
-            print(f"✓ Terminal event accepted")
-            return True
-        else:
-            print(f"✗ Terminal event failed: {response.get('error')}")
-            return False
-    finally:
-        await client.disconnect()
+    def send_nowait(self, msg_type: str, data: dict = None) -> asyncio.Future:
+        """Queue a message and return its response future
 
+        Lets callers batch several frames into one kernel write: queue
+        them all, then await flush() once, then gather the futures.
+        Frames in the same batch share one timestamp sample.
+        """
+        if self._batch_ts is None:
+            self._batch_ts = self._now_ms()
+        return self._queue_message(msg_type, data, ts=self._batch_ts)[1]
 
-@pytest.mark.skipif(SKIP_IPC_TESTS, reason=SKIP_REASON)
-@pytest.mark.asyncio
-async def test_resolve_path():
-    """Test resolve_path query (StateLinker)"""
-    print("\n=== Test: Resolve Path ===")
+    async def flush(self):
+        """Yield so queued frames reach the kernel in one write
 
-    client = IPCTestClient()
-    try:
-        if not await client.connect():
-            return False
+        Raw transports buffer internally and flush from the event loop;
+        one trip through the loop is all a batch needs.
+        """
+        self._batch_ts = None
+        await asyncio.sleep(0)
 
-        response = await client.send("resolve_path", {
-            "path": "test.py"
-        })
+    async def send(self, msg_type: str, data: dict = None, timeout: float = 5.0) -> dict:
+        """Send message and wait for response"""
+        async with self._send_lock:
+            msg_id, future = self._queue_message(msg_type, data)
 
-        if response.get("ok") is not None:
-            data = response.get("data", {})
-            print(f"✓ Resolve path response received")
-            print(f"  - Partial: {data.get('partial', 'N/A')}")
-            print(f"  - Resolved: {data.get('resolved', 'None')}")
-            print(f"  - Found: {data.get('found', False)}")
-            return True
-        else:
-            error = response.get("error", "Unknown error")
-            if "StateLinker not initialized" in error:
-                print(f"⚠ StateLinker not ready yet (expected on fresh daemon)")
-                return True
-            print(f"✗ Resolve path failed: {error}")
-            return False
-    finally:
-        await client.disconnect()
+        # Wait for the demuxed response
+        try:
+            return await asyncio.wait_for(future, timeout=timeout)
+        except asyncio.TimeoutError:
+            self._pending.pop(msg_id, None)
+            return {"ok": False, "error": "Response timeout"}
 
 
-@pytest.mark.skipif(SKIP_IPC_TESTS, reason=SKIP_REASON)
-@pytest.mark.asyncio
-async def test_file_edit_event():
-    """Test file_edit event handling"""
-    print("\n=== Test: File Edit Event ===")
+if PYTEST_ASYNCIO_AVAILABLE:
+    @pytest_asyncio.fixture(scope="session")
+    async def ipc_client():
+        """One connected client for the whole session
 
-    client = IPCTestClient()
-    try:
+        Connecting is the expensive part of each of these tests
+        (socket(), connect(), stream setup and teardown), so do it once
+        and share; the client's send lock keeps request/response pairs
+        atomic on the shared connection.
+        """
+        if not _daemon_available():
+            pytest.skip("Skipped: daemon is not running")
+        client = IPCTestClient()
         if not await client.connect():
-            return False
-
-        # Send file edit event with test data
-        response = await client.send("file_edit", {
-            "file": f"/tmp/{TEST_SUBJECT}_edit.py",
-            "gist": f"Test edit from {TEST_SUBJECT}",
-            "change": "save",
-            "lang": "python",
-            "lines": 100
-        })
-
-        if response.get("ok") or response.get("type") == "ack":
-            print(f"✓ File edit event accepted")
-            return True
-        else:
-            print(f"✗ File edit event failed: {response.get('error')}")
-            return False
-    finally:
+            pytest.skip("Could not connect to daemon")
+        yield client
         await client.disconnect()
+else:
+    @pytest.fixture(scope="session")
+    def ipc_client():
+        pytest.skip(SKIP_REASON)
+
+
+def _check_pong(response):
+    """Basic connectivity: daemon answers ping with pong"""
+    if response.get("type") == "pong" and response.get("ok", True):
+        print("✓ Ping/Pong successful")
+        return True
+    print(f"✗ Unexpected response: {response}")
+    return False
+
+
+def _check_ok(response):
+    """Events (focus) must come back ok
+
+    Note: the response may indicate accepted=False if the file doesn't
+    exist (Reality Grounding validation) — that still counts as ok.
+    """
+    if response.get("ok"):
+        print(f"✓ Event accepted: {response.get('data', {})}")
+        return True
+    print(f"✗ Event failed: {response.get('error')}")
+    return False
+
+
+def _check_ok_or_ack(response):
+    """Fire-and-forget events (terminal/file_edit/diagnostic) may ack"""
+    if response.get("ok") or response.get("type") == "ack":
+        print(f"✓ Event accepted")
+        return True
+    print(f"✗ Event failed: {response.get('error')}")
+    return False
+
+
+def _check_statelinker_query(response):
+    """StateLinker queries tolerate a daemon that just started"""
+    if response.get("ok"):
+        print(f"✓ Query successful: {response.get('data', {})}")
+        return True
+    error = response.get("error", "Unknown error")
+    if "StateLinker not initialized" in error:
+        print(f"⚠ StateLinker not ready yet (expected on fresh daemon)")
+        return True
+    print(f"✗ Query failed: {error}")
+    return False
+
+
+def _check_response_received(response):
+    """resolve_path only needs a well-formed response either way"""
+    if response.get("ok") is not None:
+        print(f"✓ Response received: {response.get('data', {})}")
+        return True
+    return _check_statelinker_query(response)
+
+
+# One row per protocol message: (battery name, type, payload, checker).
+# A single parametrized test keeps per-case reporting while paying
+# collection/fixture overhead once instead of seven times.
+EVENT_CASES = [
+    ("Ping/Pong", "ping", None, _check_pong),
+    ("Focus Event", "focus", {
+        "file": f"/tmp/{TEST_SUBJECT}_test.py",
+        "line": 42,
+        "column": 10,
+        "selection": "def test_function():",
+        "project_root": "/tmp"
+    }, _check_ok),
+    ("Get Focus", "get_focus", {}, _check_statelinker_query),
+    ("Terminal Event", "terminal", {
+        "cmd": f"echo {TEST_SUBJECT}",
+        "code": 0,
+        "out": f"Output from {TEST_SUBJECT}",
+        "err": "",
+        "dur": 100
+    }, _check_ok_or_ack),
+    ("Resolve Path", "resolve_path", {
+        "path": "test.py"
+    }, _check_response_received),
+    ("File Edit Event", "file_edit", {
+        "file": f"/tmp/{TEST_SUBJECT}_edit.py",
+        "gist": f"Test edit from {TEST_SUBJECT}",
+        "change": "save",
+        "lang": "python",
+        "lines": 100
+    }, _check_ok_or_ack),
+    ("Diagnostic Event", "diagnostic", {
+        "file": f"/tmp/{TEST_SUBJECT}_diag.py",
+        "sev": 0,  # Error
+        "msg": f"Test error from {TEST_SUBJECT}",
+        "ln": 10,
+        "src": "pytest"
+    }, _check_ok_or_ack),
+]
 
 
 @pytest.mark.skipif(SKIP_IPC_TESTS, reason=SKIP_REASON)
 @pytest.mark.asyncio
-async def test_diagnostic_event():
-    """Test diagnostic event handling (Zombie Killer)"""
-    print("\n=== Test: Diagnostic Event ===")
-
-    client = IPCTestClient()
-    try:
-        if not await client.connect():
-            return False
-
-        # Send diagnostic event with test data (error severity)
-        response = await client.send("diagnostic", {
-            "file": f"/tmp/{TEST_SUBJECT}_diag.py",
-            "sev": 0,  # Error
-            "msg": f"Test error from {TEST_SUBJECT}",
-            "ln": 10,
-            "src": "pytest"
-        })
-
-        if response.get("ok") or response.get("type") == "ack":
-            print(f"✓ Diagnostic event accepted")
-            return True
-        else:
-            print(f"✗ Diagnostic event failed: {response.get('error')}")
-            return False
-    finally:
-        await client.disconnect()
+@pytest.mark.parametrize(
+    "msg_type,payload,check",
+    [(c[1], c[2], c[3]) for c in EVENT_CASES],
+    ids=[c[1] for c in EVENT_CASES]
+)
+async def test_ipc_event(ipc_client, msg_type, payload, check):
+    """Send each protocol message and validate its response"""
+    print(f"\n=== Test: {msg_type} ===")
+    response = await ipc_client.send(msg_type, payload)
+    assert check(response), f"{msg_type} response failed validation: {response}"
 
 
 async def run_all_tests():
@@ -384,29 +460,41 @@ async def run_all_tests():
     print("=" * 60)
     print(f"  PHASE 5 IPC INTEGRATION TESTS")
     print(f"  Test Subject: {TEST_SUBJECT}")
-    print(f"  Daemon Socket: {get_pipe_path()}")
+    print(f"  Daemon Socket: {_PIPE_PATH}")
     print("=" * 60)
 
     results = {}
 
-    # Test battery
-    tests = [
-        ("Ping/Pong", test_ping_pong),
-        ("Focus Event", test_focus_event),
-        ("Get Focus", test_get_focus),
-        ("Terminal Event", test_terminal_event),
-        ("Resolve Path", test_resolve_path),
-        ("File Edit Event", test_file_edit_event),
-        ("Diagnostic Event", test_diagnostic_event),
-    ]
-
-    for name, test_fn in tests:
+    # One connection for the whole battery, matching the pytest fixture
+    client = IPCTestClient()
+    if not await client.connect():
+        return False
+
+    try:
+        for name, msg_type, payload, check in EVENT_CASES:
+            print(f"\n=== Test: {name} ===")
+            try:
+                response = await client.send(msg_type, payload)
+                results[name] = check(response)
+            except Exception as e:
+                print(f"✗ {name} raised exception: {e}")
+                results[name] = False
+
+        # Pipelined batch: queue several frames, flush once, gather —
+        # exercises send_nowait()/flush() and the demux under load
+        print("\n=== Test: Pipelined Batch ===")
         try:
-            result = await test_fn()
-            results[name] = result
+            futures = [client.send_nowait("ping") for _ in range(7)]
+            await client.flush()
+            responses = await asyncio.wait_for(asyncio.gather(*futures), timeout=5.0)
+            ok = all(r.get("type") == "pong" and r.get("ok", True) for r in responses)
+            print(f"{'✓' if ok else '✗'} {len(responses)} pipelined pings, one flush")
+            results["Pipelined Batch"] = ok
         except Exception as e:
-            print(f"✗ {name} raised exception: {e}")
-            results[name] = False
+            print(f"✗ Pipelined batch raised exception: {e}")
+            results["Pipelined Batch"] = False
+    finally:
+        await client.disconnect()
 
     # Summary
     print("\n" + "=" * 60)
@@ -429,6 +517,13 @@ async def run_all_tests():
 
 def main():
     """Main entry point"""
+    if sys.platform != 'win32':
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
+
     try:
         success = asyncio.run(run_all_tests())
         sys.exit(0 if success else 1)
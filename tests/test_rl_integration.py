@@ -1,62 +1,54 @@
 """Test RL Agent integrated into koshas.py"""
+from loguru import logger
+
 from vidurai.core.koshas import ViduraiMemory
 from vidurai.core.rl_agent_v2 import RewardProfile
 
-print("=" * 70)
-print("🧠 TESTING RL AGENT INTEGRATION")
-print("=" * 70)
-
 # Create memory system with RL Agent
-print("\n🔧 Creating ViduraiMemory with RL Agent...")
+logger.info("Creating ViduraiMemory with RL Agent...")
 memory = ViduraiMemory(
     enable_compression=True,
     enable_rl_agent=True,
     reward_profile=RewardProfile.BALANCED
 )
 
-print(f"✅ Created with RL Agent")
-print(f"   Compression enabled: {memory.compression_enabled}")
-print(f"   RL Agent enabled: {memory.rl_agent_enabled}")
+logger.info("Created with RL Agent")
+logger.info("  Compression enabled: {}", memory.compression_enabled)
+logger.info("  RL Agent enabled: {}", memory.rl_agent_enabled)
 
 # Add messages and watch agent make decisions
-print("\n📝 Adding 15 messages (agent will decide when to compress)...")
+logger.info("Adding 15 messages (agent will decide when to compress)...")
 for i in range(15):
     content = f"Message {i}: Working on AI project Vidurai with memory compression"
     memory.remember(content, importance=0.6)
-    
+
     # Check if agent took action
     stats = memory.get_rl_agent_stats()
     if i > 0 and stats['actions_taken'] > 0:
-        print(f"   Message {i}: Agent took {stats['actions_taken']} action(s)")
+        logger.info("  Message {}: Agent took {} action(s)", i, stats['actions_taken'])
 
 # Get final statistics
-print("\n📊 Final Statistics:")
-print("\n   RL Agent:")
+logger.info("RL Agent statistics:")
 rl_stats = memory.get_rl_agent_stats()
 for key, value in rl_stats.items():
     if isinstance(value, float):
-        print(f"      {key}: {value:.3f}")
+        logger.info("  {}: {:.3f}", key, value)
     else:
-        print(f"      {key}: {value}")
+        logger.info("  {}: {}", key, value)
 
-print("\n   Compression:")
 comp_stats = memory.get_compression_stats()
-print(f"      Total compressions: {comp_stats['total_compressions']}")
-print(f"      Total tokens saved: {comp_stats['total_tokens_saved']}")
+logger.info("Compression: {} compressions, {} tokens saved",
+            comp_stats['total_compressions'], comp_stats['total_tokens_saved'])
 
-print("\n   Memory Layers:")
-print(f"      Working: {len(memory.working.memories)} memories")
-print(f"      Episodic: {len(memory.episodic.memories)} memories")
+logger.info("Memory layers: working={} episodic={}",
+            len(memory.working.memories), len(memory.episodic.memories))
 
 # End conversation (triggers epsilon decay)
-print("\n🏁 Ending conversation...")
+logger.info("Ending conversation...")
 memory.end_conversation()
 final_stats = memory.get_rl_agent_stats()
-print(f"   Episodes: {final_stats['episodes']}")
-print(f"   Epsilon: {final_stats['epsilon']:.3f}")
-print(f"   Maturity: {final_stats['maturity']:.1f}%")
-
-print("\n" + "=" * 70)
-print("✅ RL AGENT INTEGRATION SUCCESSFUL!")
-print("   The agent is learning optimal compression policies")
-print("=" * 70)
\ No newline at end of file
+logger.info("  Episodes: {}", final_stats['episodes'])
+logger.info("  Epsilon: {:.3f}", final_stats['epsilon'])
+logger.info("  Maturity: {:.1f}%", final_stats['maturity'])
+
+logger.info("RL agent integration successful — learning optimal compression policies")
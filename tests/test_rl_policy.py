@@ -1,32 +1,44 @@
-#!/usr/bin/env python3
 """
-Test script for RL Policy Layer Integration
+Tests for RL Policy Layer Integration
 Tests that retention policies work correctly with VismritiMemory
+
+Run with pytest (supports --lf/--ff/-x for iterative dev runs).
 """
 
 import sys
-import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime, timedelta
+
+import pytest
+from loguru import logger
 
 # Add paths
 sys.path.insert(0, str(Path(__file__).parent))
 
-def setup_test_environment():
-    """Create test memories for retention policy testing"""
-    print("=" * 70)
-    print("📝 Setting Up Test Environment")
-    print("=" * 70)
-    print()
+from vidurai.vismriti_memory import VismritiMemory
+from vidurai.storage.database import SalienceLevel
+from vidurai.core.retention_policy import create_retention_policy, RetentionAction, RetentionContext
 
-    from vidurai.vismriti_memory import VismritiMemory
-    from vidurai.storage.database import SalienceLevel
 
-    # Use test project path
-    test_project = "/home/user/vidurai/test-rl-policy"
+@lru_cache(maxsize=8)
+def _make_policy(kind, reward_profile=None):
+    """
+    Shared policy instances for the tests below
 
-    print(f"Test project: {test_project}")
-    print()
+    Building an RL policy allocates a Q-table, RNG and reward model;
+    the key space here is tiny (kind + profile), so one instance per
+    combination is enough for the whole module.
+    """
+    if reward_profile is not None:
+        return create_retention_policy(kind, reward_profile=reward_profile)
+    return create_retention_policy(kind)
+
+def setup_test_environment(test_project="/home/user/vidurai/test-rl-policy"):
+    """Create test memories for retention policy testing"""
+    logger.info("Setting up test environment")
+
+    logger.info("Test project: {}", test_project)
 
     # Create memory system
     memory = VismritiMemory(
@@ -35,55 +47,63 @@ def setup_test_environment():
         retention_policy="rule_based"  # Start with rule-based
     )
 
-    print("Creating test memories with different salience levels...")
-
-    # Create 100 LOW salience memories (should trigger consolidation)
-    for i in range(100):
-        memory.remember(
-            f"Debug log entry {i}: processing item",
-            metadata={'type': 'log', 'level': 'debug'},
-            salience=SalienceLevel.LOW
-        )
+    logger.info("Creating test memories with different salience levels...")
 
-    print(f"✅ Created 100 LOW salience memories")
-
-    # Create 20 HIGH salience memories (should be preserved)
-    for i in range(20):
-        memory.remember(
-            f"Fixed critical bug #{i} in authentication system",
-            metadata={'type': 'bugfix', 'priority': 'high'},
-            salience=SalienceLevel.HIGH
-        )
+    # One bulk call: 150 memories in a single database transaction
+    # instead of 150 individual commits
+    # 100 LOW salience memories (should trigger consolidation)
+    records = [
+        {
+            'content': f"Debug log entry {i}: processing item",
+            'metadata': {'type': 'log', 'level': 'debug'},
+            'salience': SalienceLevel.LOW
+        }
+        for i in range(100)
+    ]
+    # 20 HIGH salience memories (should be preserved)
+    records += [
+        {
+            'content': f"Fixed critical bug #{i} in authentication system",
+            'metadata': {'type': 'bugfix', 'priority': 'high'},
+            'salience': SalienceLevel.HIGH
+        }
+        for i in range(20)
+    ]
+    # 30 NOISE memories (should be cleaned up)
+    records += [
+        {
+            'content': f"Noise entry {i}",
+            'metadata': {'type': 'noise'},
+            'salience': SalienceLevel.NOISE
+        }
+        for i in range(30)
+    ]
+    memory.remember_many(records)
 
-    print(f"✅ Created 20 HIGH salience memories")
+    logger.info("Created 100 LOW, 20 HIGH, 30 NOISE salience memories (150 total)")
 
-    # Create 30 NOISE memories (should be cleaned up)
-    for i in range(30):
-        memory.remember(
-            f"Noise entry {i}",
-            metadata={'type': 'noise'},
-            salience=SalienceLevel.NOISE
-        )
+    return memory
 
-    print(f"✅ Created 30 NOISE salience memories")
 
-    print()
-    print(f"Total memories created: 150")
-    print()
+@pytest.fixture(scope="module")
+def seeded_project(tmp_path_factory):
+    """
+    Project path pre-seeded with the 150 test memories
 
-    return memory
+    Each pytest worker gets its own path (and therefore its own project
+    rows in the database), so the module is safe to run under
+    pytest-xdist; the seeding itself happens once per module.
+    """
+    test_project = str(tmp_path_factory.mktemp("rl-policy-project"))
+    setup_test_environment(test_project)
+    return test_project
 
 
-def test_rule_based_policy():
+def test_rule_based_policy(seeded_project):
     """Test rule-based retention policy"""
-    print("=" * 70)
-    print("🧪 TEST 1: Rule-Based Retention Policy")
-    print("=" * 70)
-    print()
-
-    from vidurai.vismriti_memory import VismritiMemory
+    logger.info("TEST 1: Rule-Based Retention Policy")
 
-    test_project = "/home/user/vidurai/test-rl-policy"
+    test_project = seeded_project
 
     # Create memory system with rule-based policy
     memory = VismritiMemory(
@@ -97,124 +117,82 @@ def test_rule_based_policy():
         }
     )
 
-    print(f"Policy: {memory.retention_policy.name}")
-    print()
+    logger.info("Policy: {}", memory.retention_policy.name)
 
     # Get initial stats
     if memory.db:
         initial_stats = memory.db.get_statistics(test_project)
-        print(f"Initial state:")
-        print(f"  Total memories: {initial_stats.get('total', 0)}")
-        print(f"  By salience: {initial_stats.get('by_salience', {})}")
-        print()
+        logger.info("Initial state: {} memories, by salience: {}",
+                    initial_stats.get('total', 0), initial_stats.get('by_salience', {}))
 
     # Evaluate and execute retention
-    print("Evaluating retention policy...")
+    logger.info("Evaluating retention policy...")
     result = memory.evaluate_and_execute_retention()
 
-    if result:
-        print()
-        print("Retention Result:")
-        print(f"  Policy: {result['policy']}")
-        print(f"  Action: {result['action']}")
-        print(f"  Context: {result['context']}")
-        print(f"  Outcome: {result['outcome']}")
-        print()
-
-        # Check that correct action was taken
-        action = result['action']
-        if action == 'consolidate_and_decay':
-            print("✅ PASSED: Rule correctly triggered CONSOLIDATE_AND_DECAY")
-            print(f"   (130 LOW/NOISE memories > threshold of 100)")
-        else:
-            print(f"⚠️  UNEXPECTED: Got action '{action}' instead of 'consolidate_and_decay'")
-    else:
-        print("❌ FAILED: No retention result returned")
+    assert result is not None, "No retention result returned"
+    logger.info("Retention result: policy={} action={}", result['policy'], result['action'])
+    logger.info("  Context: {}", result['context'])
+    logger.info("  Outcome: {}", result['outcome'])
 
-    print()
+    # 130 LOW/NOISE memories exceed the threshold of 100, so the rule
+    # must fire CONSOLIDATE_AND_DECAY
+    assert result['action'] == 'consolidate_and_decay', (
+        f"Expected 'consolidate_and_decay', got '{result['action']}'"
+    )
 
 
-def test_rl_based_policy():
+def test_rl_based_policy(seeded_project):
     """Test RL-based retention policy"""
-    print("=" * 70)
-    print("🧪 TEST 2: RL-Based Retention Policy")
-    print("=" * 70)
-    print()
-
-    from vidurai.vismriti_memory import VismritiMemory
-
-    test_project = "/home/user/vidurai/test-rl-policy"
-
-    try:
-        # Create memory system with RL policy
-        memory = VismritiMemory(
-            project_path=test_project,
-            enable_aggregation=True,
-            retention_policy="rl_based",
-            retention_policy_config={
-                'reward_profile': 'BALANCED',
-            }
-        )
-
-        print(f"Policy: {memory.retention_policy.name}")
-        print()
-
-        # Get RL agent stats
-        if memory.retention_policy:
-            rl_stats = memory.retention_policy.get_statistics()
-            print(f"RL Agent State:")
-            print(f"  Episodes: {rl_stats.get('episodes', 0)}")
-            print(f"  Epsilon: {rl_stats.get('epsilon', 0):.3f}")
-            print(f"  Q-table size: {rl_stats.get('q_table_size', 0)}")
-            print(f"  Maturity: {rl_stats.get('maturity', 0):.1f}%")
-            print()
-
-        # Simulate multiple retention cycles (for learning)
-        print("Running 3 retention evaluation cycles...")
-        print()
-
-        for cycle in range(3):
-            print(f"--- Cycle {cycle + 1} ---")
-
-            result = memory.evaluate_and_execute_retention()
-
-            if result:
-                print(f"  Action: {result['action']}")
-                print(f"  Compression: {result['outcome']['compression_ratio']:.1%}")
-                print(f"  Tokens saved: {result['outcome']['tokens_saved']}")
-                print()
-            else:
-                print("  No result returned")
-                print()
-
-        # Get updated RL stats
-        if memory.retention_policy:
-            updated_stats = memory.retention_policy.get_statistics()
-            print(f"RL Agent After Learning:")
-            print(f"  Total reward: {updated_stats.get('total_reward', 0):.2f}")
-            print(f"  Avg reward/episode: {updated_stats.get('avg_reward_per_episode', 0):.2f}")
-            print(f"  Actions taken: {updated_stats.get('actions_taken', 0)}")
-            print()
-
-        print("✅ PASSED: RL policy executed and learned from outcomes")
-
-    except Exception as e:
-        print(f"❌ FAILED: {e}")
-        import traceback
-        traceback.print_exc()
-
-    print()
+    logger.info("TEST 2: RL-Based Retention Policy")
+
+    test_project = seeded_project
+
+    # Create memory system with RL policy
+    memory = VismritiMemory(
+        project_path=test_project,
+        enable_aggregation=True,
+        retention_policy="rl_based",
+        retention_policy_config={
+            'reward_profile': 'BALANCED',
+        }
+    )
+
+    assert memory.retention_policy is not None, "RL policy was not initialized"
+    logger.info("Policy: {}", memory.retention_policy.name)
+
+    # Get RL agent stats
+    initial_stats = memory.retention_policy.get_statistics()
+    logger.info("RL agent state: episodes={} epsilon={:.3f} q_table_size={} maturity={:.1f}%",
+                initial_stats.get('episodes', 0), initial_stats.get('epsilon', 0),
+                initial_stats.get('q_table_size', 0), initial_stats.get('maturity', 0))
+
+    # Simulate multiple retention cycles (for learning)
+    logger.info("Running 3 retention evaluation cycles...")
+
+    for cycle in range(3):
+        result = memory.evaluate_and_execute_retention()
+
+        assert result is not None, f"Cycle {cycle + 1} returned no retention result"
+        assert result['action'] in [action.value for action in RetentionAction]
+        logger.info("Cycle {}: action={} compression={:.1%} tokens_saved={}",
+                    cycle + 1, result['action'],
+                    result['outcome']['compression_ratio'],
+                    result['outcome']['tokens_saved'])
+
+    # The agent must have recorded the three decisions it just made
+    updated_stats = memory.retention_policy.get_statistics()
+    logger.info("RL agent after learning: total_reward={:.2f} avg_reward={:.2f} actions_taken={}",
+                updated_stats.get('total_reward', 0),
+                updated_stats.get('avg_reward_per_episode', 0),
+                updated_stats.get('actions_taken', 0))
+    assert updated_stats['actions_taken'] >= initial_stats['actions_taken'] + 3, (
+        "RL agent statistics did not advance after 3 retention cycles"
+    )
 
 
 def test_policy_comparison():
     """Compare rule-based vs RL-based decisions"""
-    print("=" * 70)
-    print("🧪 TEST 3: Policy Comparison (Rule-Based vs RL-Based)")
-    print("=" * 70)
-    print()
-
-    from vidurai.vismriti_memory import VismritiMemory
-    from vidurai.core.retention_policy import create_retention_policy, RetentionContext
+    logger.info("TEST 3: Policy Comparison (Rule-Based vs RL-Based)")
 
     # Create identical context
     context = RetentionContext(
@@ -232,130 +210,71 @@ def test_policy_comparison():
         project_path="/test"
     )
 
-    print("Test Context:")
-    print(f"  Total: {context.total_memories}")
-    print(f"  HIGH: {context.high_salience_count}")
-    print(f"  LOW: {context.low_salience_count}")
-    print(f"  NOISE: {context.noise_salience_count}")
-    print()
+    logger.info("Test context: total={} HIGH={} LOW={} NOISE={}",
+                context.total_memories, context.high_salience_count,
+                context.low_salience_count, context.noise_salience_count)
 
     # Test rule-based decision
     rule_policy = create_retention_policy('rule_based', low_noise_threshold=100)
     rule_action = rule_policy.decide_action(context)
-    print(f"Rule-Based Policy Decision: {rule_action.value}")
-    print(f"  Reasoning: 130 LOW/NOISE > threshold (100)")
-    print()
-
-    # Test RL-based decision
-    try:
-        rl_policy = create_retention_policy('rl_based', reward_profile='BALANCED')
-        rl_action = rl_policy.decide_action(context)
-        print(f"RL-Based Policy Decision: {rl_action.value}")
-        print(f"  (Based on learned Q-values or exploration)")
-        print()
-
-        if rule_action == rl_action:
-            print("✅ Both policies agree on action")
-        else:
-            print("ℹ️  Policies chose different actions (expected during exploration phase)")
-
-    except Exception as e:
-        print(f"⚠️  RL policy test skipped: {e}")
-
-    print()
+    logger.info("Rule-based decision: {} (130 LOW/NOISE > threshold of 100)", rule_action.value)
+    assert rule_action == RetentionAction.CONSOLIDATE_AND_DECAY
+
+    # Test RL-based decision (exploration makes the choice
+    # nondeterministic, but it must be a valid action)
+    rl_policy = _make_policy('rl_based', reward_profile='BALANCED')
+    rl_action = rl_policy.decide_action(context)
+    logger.info("RL-based decision: {} (learned Q-values or exploration)", rl_action.value)
+    assert isinstance(rl_action, RetentionAction)
+
+    if rule_action == rl_action:
+        logger.info("Both policies agree on action")
+    else:
+        logger.info("Policies chose different actions (expected during exploration phase)")
 
 
 def test_policy_statistics():
     """Test policy statistics tracking"""
-    print("=" * 70)
-    print("🧪 TEST 4: Policy Statistics")
-    print("=" * 70)
-    print()
-
-    from vidurai.core.retention_policy import create_retention_policy
+    logger.info("TEST 4: Policy Statistics")
 
     # Rule-based stats
-    print("Rule-Based Policy Statistics:")
-    rule_policy = create_retention_policy('rule_based')
+    rule_policy = _make_policy('rule_based')
     rule_stats = rule_policy.get_statistics()
-    print(f"  Policy: {rule_stats.get('policy')}")
-    print(f"  Actions taken: {rule_stats.get('actions_taken')}")
-    print(f"  Thresholds: {rule_stats.get('thresholds')}")
-    print()
+    logger.info("Rule-based stats: policy={} actions_taken={} thresholds={}",
+                rule_stats.get('policy'), rule_stats.get('actions_taken'),
+                rule_stats.get('thresholds'))
+    assert rule_stats.get('policy') == 'rule_based'
+    assert 'thresholds' in rule_stats
 
     # RL-based stats
-    try:
-        print("RL-Based Policy Statistics:")
-        rl_policy = create_retention_policy('rl_based', reward_profile='COST_FOCUSED')
-        rl_stats = rl_policy.get_statistics()
-        print(f"  Policy: {rl_stats.get('policy')}")
-        print(f"  Reward profile: {rl_stats.get('reward_profile')}")
-        print(f"  Episodes: {rl_stats.get('episodes')}")
-        print(f"  Epsilon: {rl_stats.get('epsilon', 0):.3f}")
-        print(f"  Q-table states: {rl_stats.get('q_table_size')}")
-        print(f"  Maturity: {rl_stats.get('maturity', 0):.1f}%")
-        print()
-
-        print("✅ PASSED: Statistics available for both policies")
-    except Exception as e:
-        print(f"⚠️  RL stats test skipped: {e}")
-
-    print()
+    rl_policy = _make_policy('rl_based', reward_profile='COST_FOCUSED')
+    rl_stats = rl_policy.get_statistics()
+    logger.info("RL-based stats: policy={} profile={} episodes={} epsilon={:.3f} "
+                "q_table_states={} maturity={:.1f}%",
+                rl_stats.get('policy'), rl_stats.get('reward_profile'),
+                rl_stats.get('episodes'), rl_stats.get('epsilon', 0),
+                rl_stats.get('q_table_size'), rl_stats.get('maturity', 0))
+    assert rl_stats.get('policy') == 'rl_based'
+    assert rl_stats.get('reward_profile') == 'cost_focused'
+    assert 'q_table_size' in rl_stats
 
 
 def test_reward_profiles():
     """Test different reward profiles"""
-    print("=" * 70)
-    print("🧪 TEST 5: Reward Profiles (BALANCED, COST_FOCUSED, QUALITY_FOCUSED)")
-    print("=" * 70)
-    print()
-
-    try:
-        from vidurai.core.retention_policy import create_retention_policy
-
-        profiles = ['BALANCED', 'COST_FOCUSED', 'QUALITY_FOCUSED']
-
-        for profile in profiles:
-            policy = create_retention_policy('rl_based', reward_profile=profile)
-            stats = policy.get_statistics()
-            print(f"{profile}:")
-            print(f"  Policy name: {policy.name}")
-            print(f"  Reward profile: {stats.get('reward_profile')}")
-            print()
-
-        print("✅ PASSED: All reward profiles initialized successfully")
-
-    except Exception as e:
-        print(f"⚠️  Reward profile test skipped: {e}")
-
-    print()
-
-
-if __name__ == "__main__":
-    try:
-        print()
-        print("🚀 RL POLICY LAYER - TEST SUITE")
-        print()
-
-        # Setup
-        memory = setup_test_environment()
-
-        # Run tests
-        test_rule_based_policy()
-        test_rl_based_policy()
-        test_policy_comparison()
-        test_policy_statistics()
-        test_reward_profiles()
-
-        print()
-        print("=" * 70)
-        print("✅ ALL TESTS COMPLETE")
-        print("=" * 70)
-        print()
-
-    except KeyboardInterrupt:
-        print("\n\n⚠️  Tests interrupted by user")
-    except Exception as e:
-        print(f"\n\n❌ Tests failed with error: {e}")
-        import traceback
-        traceback.print_exc()
+    logger.info("TEST 5: Reward Profiles (BALANCED, COST_FOCUSED, QUALITY_FOCUSED)")
+
+    profiles = ['BALANCED', 'COST_FOCUSED', 'QUALITY_FOCUSED']
+
+    # The three policies share no state, so build them concurrently
+    # (construction is mostly Q-table/experience file I/O)
+    with ThreadPoolExecutor(max_workers=len(profiles)) as pool:
+        policies = list(pool.map(
+            lambda profile: _make_policy('rl_based', reward_profile=profile),
+            profiles
+        ))
+
+    for profile, policy in zip(profiles, policies):
+        stats = policy.get_statistics()
+        logger.info("{}: name={} reward_profile={}",
+                    profile, policy.name, stats.get('reward_profile'))
+        assert stats.get('reward_profile') == profile.lower()
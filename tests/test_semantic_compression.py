@@ -37,18 +37,21 @@ except Exception as e:
 print("\n📝 Test 3: Creating test conversation (12 messages)...")
 try:
     messages = [
-        Message(role="user", content="Hi, my name is Chandan", tokens=estimate_tokens("Hi, my name is Chandan")),
-        Message(role="assistant", content="Hello Chandan! Nice to meet you.", tokens=estimate_tokens("Hello Chandan! Nice to meet you.")),
-        Message(role="user", content="I'm from India", tokens=estimate_tokens("I'm from India")),
-        Message(role="assistant", content="Great! Which city in India?", tokens=estimate_tokens("Great! Which city in India?")),
-        Message(role="user", content="I live in Delhi", tokens=estimate_tokens("I live in Delhi")),
-        Message(role="assistant", content="Delhi is a wonderful city!", tokens=estimate_tokens("Delhi is a wonderful city!")),
-        Message(role="user", content="I work in fintech", tokens=estimate_tokens("I work in fintech")),
-        Message(role="assistant", content="Interesting! What kind of fintech?", tokens=estimate_tokens("Interesting! What kind of fintech?")),
-        Message(role="user", content="I'm building Vidurai", tokens=estimate_tokens("I'm building Vidurai")),
-        Message(role="assistant", content="Tell me more about Vidurai!", tokens=estimate_tokens("Tell me more about Vidurai!")),
-        Message(role="user", content="It's an AI memory system", tokens=estimate_tokens("It's an AI memory system")),
-        Message(role="assistant", content="That sounds fascinating!", tokens=estimate_tokens("That sounds fascinating!")),
+        Message.from_content(role, content)
+        for role, content in [
+            ("user", "Hi, my name is Chandan"),
+            ("assistant", "Hello Chandan! Nice to meet you."),
+            ("user", "I'm from India"),
+            ("assistant", "Great! Which city in India?"),
+            ("user", "I live in Delhi"),
+            ("assistant", "Delhi is a wonderful city!"),
+            ("user", "I work in fintech"),
+            ("assistant", "Interesting! What kind of fintech?"),
+            ("user", "I'm building Vidurai"),
+            ("assistant", "Tell me more about Vidurai!"),
+            ("user", "It's an AI memory system"),
+            ("assistant", "That sounds fascinating!"),
+        ]
     ]
     total_tokens = sum(m.tokens for m in messages)
     print(f"✅ Created {len(messages)} messages ({total_tokens} tokens)")
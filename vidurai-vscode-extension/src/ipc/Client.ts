@@ -117,6 +117,9 @@ function getDefaultPipePath(): string {
 
   if (process.platform === 'win32') {
     return `\\\\.\\pipe\\vidurai-${uid}`;
+  } else if (process.platform === 'linux') {
+    // Abstract-namespace socket — must match the daemon's get_pipe_path()
+    return `\0vidurai-${uid}`;
   } else {
     // Unix socket
     return path.join(os.tmpdir(), `vidurai-${uid}.sock`);
@@ -83,7 +83,8 @@ def __getattr__(name):
 def create_memory_system(
     working_capacity: int = 10,
     episodic_capacity: int = 1000,
-    aggressive_forgetting: bool = False
+    aggressive_forgetting: bool = False,
+    time_func=None
 ):
     """
     Factory function to create a complete Vidurai memory system
@@ -92,11 +93,15 @@ def create_memory_system(
         working_capacity: Size of working memory (default 10)
         episodic_capacity: Size of episodic memory (default 1000)
         aggressive_forgetting: Enable aggressive forgetting (default False)
+        time_func: Optional clock callable returning epoch seconds
+            (default time.time). Tests can inject a virtual clock to
+            advance decay windows without sleeping.
 
     Returns:
         Configured ViduraiMemory instance
     """
     # Lazy import when function is called
+    import time
     from vidurai.core.koshas import ViduraiMemory
     from vidurai.core.vismriti import VismritiEngine
     from vidurai.core.viveka import VivekaEngine
@@ -106,7 +111,10 @@ def create_memory_system(
     memory.episodic.capacity = episodic_capacity
 
     # Configure forgetting engine
-    memory.vismriti = VismritiEngine(aggressive=aggressive_forgetting)
+    memory.vismriti = VismritiEngine(
+        aggressive=aggressive_forgetting,
+        time_func=time_func or time.time
+    )
 
     # Configure conscience layer
     memory.viveka = VivekaEngine()
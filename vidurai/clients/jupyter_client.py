@@ -23,17 +23,29 @@ Usage in Jupyter:
 """
 
 import os
+import sys
 import json
 import socket
 import uuid
+import getpass
+import tempfile
 from typing import Optional, Dict, Any, Literal
 from urllib.request import urlopen, Request
 from urllib.error import URLError, HTTPError
 
 
+def _default_socket_path() -> str:
+    """Default daemon socket (mirrors vidurai.daemon.ipc.server.get_pipe_path)"""
+    uid = getpass.getuser()
+    if sys.platform == 'linux':
+        # Abstract-namespace socket — no filesystem entry
+        return f"\0vidurai-{uid}"
+    return os.path.join(tempfile.gettempdir(), f"vidurai-{uid}.sock")
+
+
 # Default daemon endpoints
 DEFAULT_HTTP_HOST = "http://localhost:7777"
-DEFAULT_SOCKET_PATH = f"/tmp/vidurai-{os.environ.get('USER', 'user')}.sock"
+DEFAULT_SOCKET_PATH = _default_socket_path()
 
 # Audience types for context retrieval
 AudienceType = Literal['developer', 'ai', 'manager', 'product', 'stakeholder']
@@ -94,7 +106,9 @@ class ViduraiLive:
 
         Args:
             http_host: HTTP endpoint of daemon (default: localhost:7777)
-            socket_path: Unix socket path (default: /tmp/vidurai-{user}.sock)
+            socket_path: Unix socket path (default: the daemon's pipe
+                path — abstract \\0vidurai-{user} on Linux, a tempdir
+                .sock file elsewhere)
             prefer_socket: Use Unix socket for IPC operations if available
             timeout: Request timeout in seconds
         """
@@ -119,8 +133,23 @@ class ViduraiLive:
             return False
 
     def _has_socket(self) -> bool:
-        """Check if Unix socket exists."""
-        return os.path.exists(self.socket_path)
+        """
+        Check if the daemon's Unix socket accepts connections.
+
+        Probes with a real connect() rather than os.path.exists:
+        abstract-namespace sockets (Linux) have no filesystem entry,
+        and a stale .sock file left by a crashed daemon would be a
+        false positive anyway.
+        """
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(0.2)
+        try:
+            sock.connect(self.socket_path)
+            return True
+        except OSError:
+            return False
+        finally:
+            sock.close()
 
     # =========================================================================
     # Context Retrieval (Main Feature)
@@ -106,6 +106,16 @@ class Message(BaseModel):
     def __str__(self):
         return f"[{self.role}]: {self.content}"
 
+    @classmethod
+    def from_content(cls, role: str, content: str) -> "Message":
+        """
+        Build a message with its token count estimated from content
+
+        Saves callers from passing the same string to estimate_tokens
+        themselves (and from estimating it twice).
+        """
+        return cls(role=role, content=content, tokens=estimate_tokens(content))
+
 
 class CompressionWindow(BaseModel):
     """
@@ -12,10 +12,16 @@ Research Foundation:
 
 from enum import Enum
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Iterable, Iterator, List, Optional, Dict, Any
 import hashlib
 from pydantic import BaseModel, Field, model_validator, ConfigDict
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 
 class SalienceLevel(int, Enum):
     """
@@ -156,4 +162,78 @@ class Memory(BaseModel):
         return bool(self.gist) and not bool(self.verbatim)
 
     def __repr__(self):
-        return f"Memory(gist='{self.gist[:50]}...', salience={self.salience.name}, status={self.status.value})"
\ No newline at end of file
+        return f"Memory(gist='{self.gist[:50]}...', salience={self.salience.name}, status={self.status.value})"
+
+
+class MemoryTable:
+    """
+    Batch container for Memory objects with columnar metadata
+
+    Keeps the Memory objects themselves authoritative (iteration and
+    view() hand back the original objects), but mirrors the numeric
+    fields that batch operations scan — salience code and creation
+    timestamp — into parallel columns so statistics over thousands of
+    memories are a single vectorized pass instead of one attribute
+    lookup per object.
+
+    Salience changes after append must go through set_salience() so the
+    column stays in sync with the object.
+    """
+
+    def __init__(self, memories: Optional[Iterable[Memory]] = None):
+        self._memories: List[Memory] = []
+        self._salience: List[int] = []       # SalienceLevel values
+        self._created_at: List[float] = []   # POSIX timestamps
+        if memories:
+            for memory in memories:
+                self.append(memory)
+
+    def append(self, memory: Memory) -> None:
+        """Add a memory and mirror its scanned fields into the columns"""
+        self._memories.append(memory)
+        self._salience.append(memory.salience.value)
+        self._created_at.append(memory.created_at.timestamp())
+
+    def view(self, index: int) -> Memory:
+        """Return the original Memory object at index"""
+        return self._memories[index]
+
+    def set_salience(self, index: int, salience: SalienceLevel) -> None:
+        """Update a memory's salience, keeping object and column in sync"""
+        self._memories[index].salience = salience
+        self._salience[index] = salience.value
+
+    def __len__(self) -> int:
+        return len(self._memories)
+
+    def __iter__(self) -> Iterator[Memory]:
+        return iter(self._memories)
+
+    def salience_counts(self) -> Dict[str, int]:
+        """
+        Count memories per salience level in one pass
+
+        Uses bincount over the salience column when numpy is available
+        (SalienceLevel values are small ints), falling back to a plain
+        Python tally.
+        """
+        counts = {level.name: 0 for level in SalienceLevel}
+        if NUMPY_AVAILABLE and self._salience:
+            binned = np.bincount(
+                np.asarray(self._salience, dtype=np.int64),
+                minlength=max(level.value for level in SalienceLevel) + 1,
+            )
+            for level in SalienceLevel:
+                counts[level.name] = int(binned[level.value])
+        else:
+            for value in self._salience:
+                counts[SalienceLevel(value).name] += 1
+        return counts
+
+    def ages_days(self, now: Optional[datetime] = None) -> List[float]:
+        """Age of every memory in days, computed against one clock read"""
+        now_ts = (now or datetime.now()).timestamp()
+        if NUMPY_AVAILABLE and self._created_at:
+            ages = (now_ts - np.asarray(self._created_at)) / 86400.0
+            return ages.tolist()
+        return [(now_ts - ts) / 86400.0 for ts in self._created_at]
\ No newline at end of file
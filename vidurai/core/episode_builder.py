@@ -23,6 +23,8 @@ Example Episode:
     - Events: 3
 """
 
+import hashlib
+import sys
 import uuid
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
@@ -38,6 +40,33 @@ except ImportError:
     ViduraiEvent = None
 
 
+def _simhash64(text: str) -> Optional[int]:
+    """64-bit SimHash of a text's whitespace tokens
+
+    Each unique token votes ±1 per bit according to its blake2b hash;
+    the signature takes the sign of each bit's tally. Similar summaries
+    land at small Hamming distance, so downstream similarity checks can
+    compare two ints instead of re-tokenizing both texts.
+    """
+    if not text:
+        return None
+
+    counts = [0] * 64
+    for token in set(text.lower().split()):
+        h = int.from_bytes(
+            hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(),
+            'big'
+        )
+        for bit in range(64):
+            counts[bit] += 1 if (h >> bit) & 1 else -1
+
+    signature = 0
+    for bit in range(64):
+        if counts[bit] > 0:
+            signature |= 1 << bit
+    return signature
+
+
 @dataclass
 class Episode:
     """
@@ -70,6 +99,15 @@ class Episode:
     summary: str = ""
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    # Set on close(): SimHash signature of the summary, consumed by
+    # PatternDetector for cheap text-similarity estimates
+    _summary_simhash: Optional[int] = field(default=None, repr=False)
+
+    # Set on close(): lowercased summary and its token set, so that
+    # similarity/pattern loops never re-lowercase or re-split per pair
+    _summary_lower: Optional[str] = field(default=None, repr=False)
+    _tokens: Optional[frozenset] = field(default=None, repr=False)
+
     @property
     def duration(self) -> timedelta:
         """Get episode duration"""
@@ -101,6 +139,18 @@ class Episode:
     def close(self, end_time: Optional[datetime] = None) -> None:
         """Close the episode"""
         self.end_time = end_time or datetime.now()
+        self._summary_simhash = _simhash64(self.summary)
+        self._summary_lower = self.summary.lower()
+        # Interned tokens hash/compare by pointer in later set ops
+        self._tokens = frozenset(
+            sys.intern(token) for token in self._summary_lower.split()
+        )
+        # Freeze the file set: interning shares one hash-cached string
+        # per path across episodes, and a frozenset is hashable for
+        # any downstream caching keyed on it
+        self.file_paths = frozenset(
+            sys.intern(path) for path in self.file_paths
+        )
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
@@ -173,8 +223,10 @@ class EpisodeBuilder:
         # Current ongoing episodes (by project_path)
         self.active_episodes: Dict[str, Episode] = {}
 
-        # Closed episodes
+        # Closed episodes; kept in close order, which is end-time
+        # order except after bulk loads (tracked by _closed_sorted)
         self.closed_episodes: List[Episode] = []
+        self._closed_sorted = True
 
         logger.info(
             f"EpisodeBuilder initialized: "
@@ -210,6 +262,32 @@ class EpisodeBuilder:
             f"({episode.event_count} events)"
         )
 
+    def handle_events_bulk(self, events: List[ViduraiEvent]) -> None:
+        """
+        Handle a batch of events in one pass
+
+        Amortized version of handle_event(): the stale-episode sweep runs
+        once for the whole batch instead of per event. Useful for
+        replaying event history (CLI replay, bulk ingest) where calling
+        handle_event in a loop pays the sweep N times.
+
+        Args:
+            events: Events to process, in order
+        """
+        if not events:
+            return
+
+        # One stale sweep for the whole batch
+        self._close_stale_episodes()
+
+        for event in events:
+            project = event.project_path or "unknown"
+            episode = self._get_or_create_episode(project, event)
+            episode.add_event(event)
+            self._update_episode_from_event(episode, event)
+
+        logger.debug(f"Processed {len(events)} events in bulk")
+
     def _get_or_create_episode(self, project: str, event: ViduraiEvent) -> Episode:
         """
         Get existing episode or create new one
@@ -344,6 +422,28 @@ class EpisodeBuilder:
         for episode in to_close:
             self._close_episode(episode)
 
+    def bulk_load_episodes(self, episodes: List[Episode]) -> None:
+        """
+        Load pre-built episodes directly, bypassing the event bus
+
+        Useful for bulk ingest (tests, history imports): N episodes are
+        appended in one call instead of N handle_event dispatches, so the
+        hint engine recomputes its patterns once instead of per episode.
+        Open episodes are closed on the way in.
+
+        Args:
+            episodes: Episodes to add to the closed list
+        """
+        for episode in episodes:
+            if not episode.is_closed:
+                episode.close()
+
+        self.closed_episodes.extend(episodes)
+        # Loaded episodes may carry arbitrary end times; re-sort lazily
+        # on the next read instead of per load
+        self._closed_sorted = False
+        logger.info(f"Bulk loaded {len(episodes)} episodes")
+
     def get_current_episode(self, project_path: Optional[str] = None) -> Optional[Episode]:
         """
         Get current active episode
@@ -373,7 +473,15 @@ class EpisodeBuilder:
         Returns:
             List of closed episodes, newest first
         """
-        return sorted(self.closed_episodes, key=lambda e: e.end_time or e.start_time, reverse=True)[:limit]
+        # Episodes close with end_time=now, so the list stays sorted
+        # between bulk loads; hint generation calls this per episode
+        # and should not pay an O(N log N) sort each time
+        if not self._closed_sorted:
+            self.closed_episodes.sort(
+                key=lambda e: e.end_time or e.start_time
+            )
+            self._closed_sorted = True
+        return self.closed_episodes[-limit:][::-1]
 
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -14,15 +14,23 @@ Design:
 - Zero dependencies on external message queues
 """
 
-import uuid
+import os
+import random
 import threading
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, Any, Optional, Callable, List
+from typing import Dict, Any, Optional, Callable, Iterator, List
 from dataclasses import dataclass, field, asdict
 from collections import deque
 from loguru import logger
 
 
+# Event IDs only need to be unique within the process (they exist for
+# debugging and cross-handler correlation, not security). A PRNG seeded once
+# from os.urandom avoids the per-event getrandom() syscall that uuid4 incurs.
+_id_rng = random.Random(os.urandom(16))
+
+
 @dataclass
 class ViduraiEvent:
     """
@@ -58,7 +66,7 @@ class ViduraiEvent:
     """
 
     # Core fields
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=lambda: format(_id_rng.getrandbits(64), "016x"))
     type: str = ""  # e.g., "terminal.command", "ai.user_message", "editor.file_save"
     timestamp: datetime = field(default_factory=datetime.now)
 
@@ -115,6 +123,10 @@ class EventBus:
 
     # Class-level state (singleton pattern)
     _handlers: List[Callable[[ViduraiEvent], None]] = []
+    # Immutable snapshot of _handlers, rebuilt on (un)subscribe. publish()
+    # reads it instead of copying the list per event — attribute reads of an
+    # immutable tuple are atomic, so the hot loop stays allocation-free.
+    _handler_snapshot: tuple = ()
     _event_buffer: deque = deque(maxlen=500)  # Ring buffer: last 500 events
     _lock: threading.Lock = threading.Lock()
     _enabled: bool = True  # Can be disabled for testing
@@ -145,11 +157,9 @@ class EventBus:
             # Add to ring buffer
             cls._event_buffer.append(event)
 
-            # Copy handlers to avoid holding lock during callbacks
-            handlers = cls._handlers.copy()
-
-        # Call handlers outside lock to prevent deadlocks
-        for handler in handlers:
+        # Read the immutable snapshot instead of copying the handler list;
+        # handlers run outside the lock to prevent deadlocks
+        for handler in cls._handler_snapshot:
             try:
                 handler(event)
             except Exception as e:
@@ -181,6 +191,7 @@ class EventBus:
         with cls._lock:
             if handler not in cls._handlers:
                 cls._handlers.append(handler)
+                cls._handler_snapshot = tuple(cls._handlers)
                 logger.debug(f"Subscribed handler: {handler.__name__}")
 
     @classmethod
@@ -196,8 +207,46 @@ class EventBus:
         with cls._lock:
             if handler in cls._handlers:
                 cls._handlers.remove(handler)
+                cls._handler_snapshot = tuple(cls._handlers)
                 logger.debug(f"Unsubscribed handler: {handler.__name__}")
 
+    @classmethod
+    @contextmanager
+    def capture(cls, type_filter: Optional[str] = None) -> Iterator[deque]:
+        """
+        Capture published events for the duration of a with-block
+
+        Subscribes a temporary handler that appends matching events to a
+        deque (O(1) amortized growth, no list reallocation churn) and
+        unsubscribes it on exit. Primarily useful in tests, replacing the
+        manual subscribe / received_events.clear() / unsubscribe dance.
+
+        Thread-safe (delegates to subscribe/unsubscribe).
+
+        Args:
+            type_filter: Optional event type prefix; only events whose
+                type starts with this prefix are captured (e.g. "memory.")
+
+        Yields:
+            Deque of captured events, in publish order
+
+        Example:
+            with EventBus.capture("memory.") as events:
+                memory.remember("Fixed auth bug")
+            assert any(e.type == "memory.created" for e in events)
+        """
+        buffer: deque = deque()
+
+        def _capture_handler(event: ViduraiEvent) -> None:
+            if type_filter is None or event.type.startswith(type_filter):
+                buffer.append(event)
+
+        cls.subscribe(_capture_handler)
+        try:
+            yield buffer
+        finally:
+            cls.unsubscribe(_capture_handler)
+
     @classmethod
     def get_recent_events(cls, limit: int = 100) -> List[ViduraiEvent]:
         """
@@ -244,6 +293,7 @@ class EventBus:
         """
         with cls._lock:
             cls._handlers.clear()
+            cls._handler_snapshot = ()
             logger.debug("All handlers cleared")
 
     @classmethod
@@ -257,6 +307,7 @@ class EventBus:
         """
         with cls._lock:
             cls._handlers.clear()
+            cls._handler_snapshot = ()
             cls._event_buffer.clear()
             cls._enabled = True
             logger.debug("EventBus reset")
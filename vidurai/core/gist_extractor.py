@@ -16,6 +16,7 @@ Process:
 """
 
 import os
+from functools import lru_cache
 from typing import Optional, Dict
 
 
@@ -43,6 +44,10 @@ class GistExtractor:
         if not self.api_key:
             raise ValueError("OPENAI_API_KEY required for gist extraction")
 
+        # Built lazily on first LLM call, then reused — keeps one HTTP
+        # session (and its TLS handshake) across extractions
+        self._client = None
+
     def extract(self, verbatim: str, context: Optional[Dict] = None) -> str:
         """
         Extract semantic gist from verbatim input
@@ -67,14 +72,14 @@ Semantic gist (one sentence, <15 words):"""
         """
         Call LLM for gist extraction
         """
-        try:
-            from openai import OpenAI
-        except ImportError:
-            raise ImportError("This feature requires optional AI dependencies. Install them with: pip install \"vidurai[ai]\"")
-
-        client = OpenAI(api_key=self.api_key)
-
-        response = client.chat.completions.create(
+        if self._client is None:
+            try:
+                from openai import OpenAI
+            except ImportError:
+                raise ImportError("This feature requires optional AI dependencies. Install them with: pip install \"vidurai[ai]\"")
+            self._client = OpenAI(api_key=self.api_key)
+
+        response = self._client.chat.completions.create(
             model=self.model,
             messages=[
                 {"role": "system", "content": "You are a semantic compression expert. Extract only the essential meaning."},
@@ -89,3 +94,22 @@ Semantic gist (one sentence, <15 words):"""
     def batch_extract(self, verbatim_list: list[str]) -> list[str]:
         """Extract gist from multiple inputs (batch processing)"""
         return [self.extract(v) for v in verbatim_list]
+
+
+@lru_cache(maxsize=4)
+def _cached_extractor(model: str, api_key: Optional[str]) -> GistExtractor:
+    """One extractor per (model, key) — see get_gist_extractor()"""
+    return GistExtractor(model=model)
+
+
+def get_gist_extractor(model: str = "gpt-4o-mini") -> GistExtractor:
+    """
+    Shared GistExtractor instance for the current API key
+
+    Repeated initializations (multiple VismritiMemory instances, test
+    runs) reuse one extractor — and therefore one HTTP client — instead
+    of opening a fresh session each time. Raises the same ValueError as
+    the constructor when no API key is set; failures are not cached, so
+    setting the key later works.
+    """
+    return _cached_extractor(model, os.getenv("OPENAI_API_KEY"))
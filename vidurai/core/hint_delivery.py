@@ -16,10 +16,25 @@ Delivery Channels:
 3. IDE Extensions - Structured data for tooltips/notifications
 """
 
+import json
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from loguru import logger
 
+# Optional C-accelerated JSON for MCP egress (~3-5x faster than stdlib)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional numpy for ranking large hint batches in C
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 try:
     from vidurai.core.proactive_hints import Hint, ProactiveHintEngine
     from vidurai.core.episode_builder import Episode, EpisodeBuilder
@@ -134,6 +149,25 @@ class HintFormatter:
             'avg_confidence': sum(h.confidence for h in hints) / len(hints) if hints else 0.0
         }
 
+    @staticmethod
+    def format_json_bytes(hints: List[Hint]) -> bytes:
+        """
+        Serialize hints straight to JSON bytes for wire egress (MCP)
+
+        Uses orjson when available, avoiding the intermediate str +
+        encode round trip of stdlib json on the hot response path.
+
+        Args:
+            hints: List of hints to format
+
+        Returns:
+            UTF-8 encoded JSON bytes
+        """
+        payload = HintFormatter.format_json(hints)
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(payload)
+        return json.dumps(payload).encode('utf-8')
+
     @staticmethod
     def format_markdown(hints: List[Hint], title: str = "Proactive Hints") -> str:
         """
@@ -213,6 +247,9 @@ class HintFilter:
     - By episode recency
     """
 
+    # Below this size Python's sorted() wins; above it numpy argsort does
+    NUMPY_SORT_THRESHOLD = 64
+
     def __init__(
         self,
         min_confidence: float = 0.5,
@@ -290,31 +327,32 @@ class HintFilter:
         """
         if ranking_method == 'confidence':
             # Sort by confidence (highest first)
-            return sorted(hints, key=lambda h: h.confidence, reverse=True)
+            key = lambda h: h.confidence
 
         elif ranking_method == 'type_priority':
             # Sort by hint type priority
-            return sorted(
-                hints,
-                key=lambda h: self.hint_type_priority.get(h.hint_type, 0),
-                reverse=True
-            )
+            key = lambda h: self.hint_type_priority.get(h.hint_type, 0)
 
         elif ranking_method == 'combined':
             # Combined: type priority * confidence
-            return sorted(
-                hints,
-                key=lambda h: self.hint_type_priority.get(h.hint_type, 0) * h.confidence,
-                reverse=True
-            )
+            key = lambda h: self.hint_type_priority.get(h.hint_type, 0) * h.confidence
 
         else:
             logger.warning(f"Unknown ranking method: {ranking_method}, using confidence")
-            return sorted(hints, key=lambda h: h.confidence, reverse=True)
+            key = lambda h: h.confidence
+
+        # For large batches, pack scores into a float array and argsort in
+        # C; stable descending order matches sorted(reverse=True)
+        if NUMPY_AVAILABLE and len(hints) > self.NUMPY_SORT_THRESHOLD:
+            scores = np.fromiter((key(h) for h in hints), dtype=np.float32, count=len(hints))
+            order = np.argsort(-scores, kind='stable')
+            return [hints[i] for i in order]
+
+        return sorted(hints, key=key, reverse=True)
 
     def deduplicate_hints(self, hints: List[Hint]) -> List[Hint]:
         """
-        Remove duplicate hints based on title similarity
+        Remove duplicate hints in a single O(N) pass, first-wins order
 
         Args:
             hints: List of hints to deduplicate
@@ -322,15 +360,16 @@ class HintFilter:
         Returns:
             Deduplicated list of hints
         """
-        seen_titles = set()
+        seen = set()
         unique = []
 
         for hint in hints:
-            # Use lowercase title as key
-            key = hint.title.lower()
+            # Key on (type, lowercase title): same title under different
+            # hint types is a distinct hint, not a duplicate
+            key = (hint.hint_type, hint.title.lower())
 
-            if key not in seen_titles:
-                seen_titles.add(key)
+            if key not in seen:
+                seen.add(key)
                 unique.append(hint)
 
         if len(unique) < len(hints):
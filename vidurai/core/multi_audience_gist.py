@@ -12,12 +12,79 @@ Philosophy: "The same memory, told differently to different listeners"
 विस्मृति भी विद्या है (Forgetting too is knowledge) - contextualized for each audience
 """
 
+import functools
 import re
-from typing import Dict, Optional, Any
+import sys
+from typing import Dict, NamedTuple, Optional, Any
 from dataclasses import dataclass
 
 from vidurai.config.multi_audience_config import MultiAudienceConfig
 
+# Precompiled patterns — these run on every generate() call, so compile
+# them once at import instead of per substitution.
+# _MGR_STRIP_RE strips technical detail from manager gists in a single
+# pass: file references, line references and acronyms. Extending the
+# jargon list means adding one alternative here.
+_MGR_STRIP_RE = re.compile(
+    r'\bin\s+[a-z]+\.(?:py|js|ts)\b'  # file references
+    r'|\bline\s+\d+\b'                # line references
+    r'|\b[A-Z]{2,}\b'                 # acronyms (JWT, API, SQL, ...)
+)
+_WS_RE = re.compile(r'\s+')
+_FIRST_PERSON_RE = re.compile(
+    r'\b(fixed|implemented|updated|created|resolved|added|learned|discovered)\b'
+)
+# Same verbs as a set: canonical gists almost always lead with the verb,
+# so the personal renderer can dispatch on the first token and skip the
+# regex pass entirely
+_FIRST_PERSON_VERBS = frozenset({
+    'fixed', 'implemented', 'updated', 'created',
+    'resolved', 'added', 'learned', 'discovered',
+})
+
+# Action verbs for the manager gist — frozenset for O(1) membership per
+# token instead of one substring scan per verb
+_ACTION_VERBS = frozenset({
+    'fixed', 'implemented', 'updated', 'created', 'deployed',
+    'resolved', 'improved', 'optimized', 'refactored', 'debugged',
+    'added', 'removed', 'configured', 'integrated', 'tested',
+})
+
+
+class GistBundle(NamedTuple):
+    """
+    Immutable bundle of the four standard audience gists
+
+    A NamedTuple is smaller than a 4-entry dict and safe to share from
+    the render cache without copying. The mapping-style helpers keep
+    existing call sites (gists['developer'], .items(), 'ai' in gists)
+    working unchanged.
+    """
+    developer: str
+    ai: str
+    manager: str
+    personal: str
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
+    def __contains__(self, key):
+        return key in self._fields
+
+    def keys(self):
+        return self._fields
+
+    def values(self):
+        return tuple(self)
+
+    def items(self):
+        return list(zip(self._fields, self))
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
 
 class MultiAudienceGistGenerator:
     """
@@ -40,6 +107,10 @@ class MultiAudienceGistGenerator:
         "Auth system stabilized"
     """
 
+    # Canonical gists shorter than this carry too little structure to
+    # rephrase per audience — return them as-is for every audience
+    MIN_RENDER_LEN = 8
+
     def __init__(
         self,
         base_gist_extractor: Optional[Any] = None,
@@ -67,24 +138,14 @@ class MultiAudienceGistGenerator:
             r'\bfunction\b', r'\bclass\b', r'\bmethod\b',
         ]
 
-        # Action verbs for manager gist
-        self.action_verbs = [
-            'fixed', 'implemented', 'updated', 'created', 'deployed',
-            'resolved', 'improved', 'optimized', 'refactored', 'debugged',
-            'added', 'removed', 'configured', 'integrated', 'tested',
-        ]
+        # One combined automaton-style scanner: a single alternation walks
+        # the input once instead of one findall per pattern per audience
+        self.tech_regex = re.compile('|'.join(self.tech_patterns), re.IGNORECASE)
 
-        # Personal conversion patterns
-        self.personal_conversions = {
-            r'\bfixed\b': 'I fixed',
-            r'\bimplemented\b': 'I implemented',
-            r'\bupdated\b': 'I updated',
-            r'\bcreated\b': 'I created',
-            r'\bresolved\b': 'I resolved',
-            r'\badded\b': 'I added',
-            r'\blearned\b': 'I learned',
-            r'\bdiscovered\b': 'I discovered',
-        }
+        # Memoized renderer — re-querying the same memories (repeated
+        # get_context_for_ai calls) re-renders identical inputs, so cache
+        # per instance keyed on (verbatim, canonical, frozen context)
+        self._render_cached = functools.lru_cache(maxsize=4096)(self._render_gists)
 
     def generate(
         self,
@@ -115,7 +176,39 @@ class MultiAudienceGistGenerator:
             manager: extract action + outcome (shorter)
             personal: convert to first-person narrative
         """
-        context = context or {}
+        # Fast path: fragments like "x" or "ok" render identically for
+        # every audience, so skip the renderers (and the cache) entirely
+        if len(canonical_gist) < self.MIN_RENDER_LEN:
+            return {audience: canonical_gist for audience in self.config.audiences}
+
+        try:
+            ctx_key = tuple(sorted((context or {}).items()))
+            gists = self._render_cached(verbatim, canonical_gist, ctx_key)
+        except TypeError:
+            # Unhashable metadata value — render without the cache
+            gists = self._render_gists(verbatim, canonical_gist, None,
+                                       context=context or {})
+
+        # Bundles are immutable and safe to share from the cache; dicts
+        # (custom audience sets) are copied so callers can't mutate it
+        return gists if isinstance(gists, GistBundle) else dict(gists)
+
+    def _render_gists(
+        self,
+        verbatim: str,
+        canonical_gist: str,
+        ctx_key: Optional[tuple],
+        context: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, str]:
+        """Render all audience gists (cached via self._render_cached)"""
+        if context is None:
+            context = dict(ctx_key or ())
+
+        # Scan the inputs once and share the results: every audience
+        # renderer used to re-scan the same verbatim/canonical itself
+        tech_terms = self.tech_regex.findall(verbatim) if verbatim else []
+        gist_lower = canonical_gist.lower()
+        gist_tokens = gist_lower.split()
 
         gists = {}
 
@@ -130,16 +223,28 @@ class MultiAudienceGistGenerator:
                 )
             elif audience == 'manager':
                 gists['manager'] = self._generate_manager_gist(
-                    verbatim, canonical_gist, context
+                    verbatim, canonical_gist, context,
+                    gist_lower=gist_lower, gist_tokens=gist_tokens
                 )
             elif audience == 'personal':
                 gists['personal'] = self._generate_personal_gist(
-                    verbatim, canonical_gist, context
+                    verbatim, canonical_gist, context,
+                    gist_lower=gist_lower, tech_terms=tech_terms
                 )
             else:
                 # Unknown audience: use canonical
                 gists[audience] = canonical_gist
 
+        # Intern the rendered gists: audiences often share a gist (and
+        # the cache re-serves them), so equal strings become the same
+        # object and downstream equality/set checks short-circuit on
+        # identity instead of re-hashing the full string
+        gists = {audience: sys.intern(gist) for audience, gist in gists.items()}
+
+        # Standard four audiences: pack into the immutable bundle; any
+        # custom audience set stays a plain dict
+        if len(gists) == len(GistBundle._fields) and set(gists) == set(GistBundle._fields):
+            return GistBundle(**gists)
         return gists
 
     def _generate_developer_gist(
@@ -163,12 +268,6 @@ class MultiAudienceGistGenerator:
         """
         gist = canonical_gist
 
-        # Extract technical terms from verbatim
-        tech_terms = []
-        for pattern in self.tech_patterns:
-            matches = re.findall(pattern, verbatim, re.IGNORECASE)
-            tech_terms.extend(matches)
-
         # Add file context if available and not in gist
         file_path = context.get('file_path', '') or context.get('file', '')
         if file_path and file_path not in gist:
@@ -237,7 +336,9 @@ class MultiAudienceGistGenerator:
         self,
         verbatim: str,
         canonical_gist: str,
-        context: Dict
+        context: Dict,
+        gist_lower: Optional[str] = None,
+        gist_tokens: Optional[list] = None
     ) -> str:
         """
         Generate manager-focused gist
@@ -252,14 +353,17 @@ class MultiAudienceGistGenerator:
             Canonical: "Fixed JWT token validation in auth middleware"
             Manager: "Auth system stabilized"
         """
-        gist = canonical_gist.lower()
-
-        # Extract action verb
-        action = None
-        for verb in self.action_verbs:
-            if verb in gist:
-                action = verb
-                break
+        gist = gist_lower if gist_lower is not None else canonical_gist.lower()
+        if gist_tokens is None:
+            gist_tokens = gist.split()
+
+        # Extract action verb: first token that is a known verb.
+        # Exact token membership also avoids false hits inside longer
+        # words (the old substring scan matched "fixed" in "prefixed")
+        action = next(
+            (token for token in gist_tokens if token in _ACTION_VERBS),
+            None
+        )
 
         # Extract outcome (after action verb)
         if action:
@@ -268,13 +372,12 @@ class MultiAudienceGistGenerator:
             if len(parts) > 1:
                 outcome = parts[1].strip()
 
-                # Remove technical details
-                outcome = re.sub(r'\bin\s+[a-z]+\.(py|js|ts)\b', '', outcome)
-                outcome = re.sub(r'\bline\s+\d+\b', '', outcome)
-                outcome = re.sub(r'\b[A-Z]{2,}\b', '', outcome)  # Acronyms
+                # Remove technical details in one pass
+
+                outcome = _MGR_STRIP_RE.sub('', outcome)
 
                 # Simplify
-                outcome = outcome.strip()
+                outcome = _WS_RE.sub(' ', outcome).strip()
                 if outcome:
                     # Capitalize action
                     manager_gist = f"{action.capitalize()} {outcome}"
@@ -287,9 +390,8 @@ class MultiAudienceGistGenerator:
                     return manager_gist
 
         # Fallback: simplify canonical
-        simplified = re.sub(r'\bin\s+[a-z]+\.(py|js|ts)\b', '', canonical_gist)
-        simplified = re.sub(r'\bline\s+\d+\b', '', simplified)
-        simplified = simplified.strip()
+        simplified = _MGR_STRIP_RE.sub('', canonical_gist)
+        simplified = _WS_RE.sub(' ', simplified).strip()
 
         words = simplified.split()
         if len(words) > 8:
@@ -301,7 +403,9 @@ class MultiAudienceGistGenerator:
         self,
         verbatim: str,
         canonical_gist: str,
-        context: Dict
+        context: Dict,
+        gist_lower: Optional[str] = None,
+        tech_terms: Optional[list] = None
     ) -> str:
         """
         Generate personal diary-style gist
@@ -316,26 +420,26 @@ class MultiAudienceGistGenerator:
             Canonical: "Fixed auth bug"
             Personal: "I fixed an authentication bug and learned about JWT tokens"
         """
-        gist = canonical_gist.lower()
-
-        # Try to convert action verbs to first-person
-        personal_gist = gist
-        for pattern, replacement in self.personal_conversions.items():
-            personal_gist = re.sub(pattern, replacement, personal_gist, count=1)
-
-        # If no conversion happened, prefix with "I worked on"
-        if personal_gist == gist:
-            personal_gist = f"I worked on {gist}"
+        gist = gist_lower if gist_lower is not None else canonical_gist.lower()
+
+        # Try to convert action verbs to first-person. Fast path: when
+        # the gist leads with a known verb (the common shape), one hash
+        # lookup replaces the regex pass
+        first = gist.partition(' ')[0]
+        if first in _FIRST_PERSON_VERBS:
+            personal_gist = f"I {gist}"
+        else:
+            personal_gist = _FIRST_PERSON_RE.sub(lambda m: f"I {m.group(1)}", gist)
+            # If no conversion happened, prefix with "I worked on"
+            if personal_gist == gist:
+                personal_gist = f"I worked on {gist}"
 
         # Add learning aspect if it's a bug/error
         if 'bug' in gist or 'error' in gist or 'issue' in gist:
             # Check if there's a technical term we "learned about"
-            tech_term = None
-            for pattern in self.tech_patterns:
-                match = re.search(pattern, verbatim, re.IGNORECASE)
-                if match:
-                    tech_term = match.group(0)
-                    break
+            if tech_terms is None:
+                tech_terms = self.tech_regex.findall(verbatim)
+            tech_term = tech_terms[0] if tech_terms else None
 
             if tech_term and len(personal_gist) < 60:
                 personal_gist = f"{personal_gist} and learned about {tech_term}"
@@ -353,11 +457,18 @@ class MultiAudienceGistGenerator:
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get generator statistics"""
+        cache_info = self._render_cached.cache_info()
         return {
             'enabled': self.config.enabled,
             'audiences': self.config.audiences,
             'use_llm': self.config.use_llm,
             'version': 'v1_rule_based',
+            'render_cache': {
+                'hits': cache_info.hits,
+                'misses': cache_info.misses,
+                'size': cache_info.currsize,
+                'max_size': cache_info.maxsize,
+            },
         }
 
 
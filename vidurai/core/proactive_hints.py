@@ -23,12 +23,24 @@ Architecture:
 - Delivery mechanisms push hints to user
 """
 
+import heapq
+import operator
+import re
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Set, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
-from collections import defaultdict, Counter
+from collections import Counter
+from itertools import combinations
 from loguru import logger
 
+# Optional: vectorized threshold/sort over similarity scores
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 try:
     from vidurai.core.episode_builder import Episode, EpisodeBuilder
     from vidurai.core.event_bus import ViduraiEvent
@@ -39,12 +51,49 @@ except ImportError:
     EpisodeBuilder = None
     ViduraiEvent = None
 
+# Common words ignored by keyword-based text similarity
+_STOPWORDS = frozenset({
+    'the', 'a', 'an', 'in', 'on', 'at', 'to', 'for', 'of', 'and', 'or', 'but'
+})
+
+# Error-related keywords, compiled once; \b boundaries also catch terms
+# followed by punctuation ("TypeError:") that whitespace splitting misses
+_ERROR_KEYWORD_RE = re.compile(
+    r'\b(?:error|exception|bug|fail|crash|issue'
+    r'|typeerror|valueerror|attributeerror|keyerror'
+    r'|nullpointer|undefined|null|nan)\b',
+    re.IGNORECASE
+)
+
 
-@dataclass
+def _canonical_pair(a: frozenset, b: frozenset) -> Tuple[frozenset, frozenset]:
+    """Order a pair of keyword sets so (x, y) and (y, x) cache alike"""
+    return (b, a) if hash(b) < hash(a) else (a, b)
+
+
+@lru_cache(maxsize=65536)
+def _jaccard_cached(keywords1: frozenset, keywords2: frozenset) -> float:
+    """Memoized Jaccard over frozen keyword sets
+
+    Recurring bugfixes make the same summary pairs come up repeatedly
+    in pattern mining; repeats become a dict lookup instead of set ops.
+    """
+    if not keywords1 or not keywords2:
+        return 0.0
+    intersection = len(keywords1 & keywords2)
+    union = len(keywords1) + len(keywords2) - intersection
+    return intersection / union if union > 0 else 0.0
+
+
+@dataclass(slots=True, frozen=True)
 class Hint:
     """
     Represents a proactive hint or suggestion
 
+    Slotted and frozen: engine runs create hundreds of hints, so
+    dropping per-instance __dict__ roughly halves their memory, and
+    immutability lets delivery layers share them freely.
+
     Attributes:
         id: Unique hint identifier
         hint_type: Type of hint (similar_episode, pattern_warning, etc.)
@@ -61,10 +110,17 @@ class Hint:
     title: str = ""
     message: str = ""
     confidence: float = 0.0  # 0.0 to 1.0
-    source_episodes: List[str] = field(default_factory=list)
+    source_episodes: Tuple[str, ...] = ()
     context: Dict[str, Any] = field(default_factory=dict)
     timestamp: datetime = field(default_factory=datetime.now)
 
+    def __post_init__(self):
+        # Accept lists from callers but store a hashable tuple
+        if not isinstance(self.source_episodes, tuple):
+            object.__setattr__(
+                self, 'source_episodes', tuple(self.source_episodes)
+            )
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
         return {
@@ -73,7 +129,7 @@ class Hint:
             'title': self.title,
             'message': self.message,
             'confidence': self.confidence,
-            'source_episodes': self.source_episodes,
+            'source_episodes': list(self.source_episodes),
             'context': self.context,
             'timestamp': self.timestamp.isoformat()
         }
@@ -94,6 +150,13 @@ class PatternDetector:
     - Successful debugging sequences
     """
 
+    # Below this many candidates plain Python beats array setup costs
+    VECTORIZE_THRESHOLD = 32
+
+    # Frequent-file vocabulary size beyond which co-modification
+    # counting switches to the membership-matrix product
+    COOC_THRESHOLD = 64
+
     def __init__(self, min_similarity: float = 0.6):
         """
         Initialize PatternDetector
@@ -107,7 +170,8 @@ class PatternDetector:
     def find_similar_episodes(
         self,
         current_episode: Episode,
-        historical_episodes: List[Episode]
+        historical_episodes: List[Episode],
+        limit: Optional[int] = None
     ) -> List[Tuple[Episode, float]]:
         """
         Find episodes similar to the current one
@@ -121,25 +185,55 @@ class PatternDetector:
         Args:
             current_episode: The current episode to compare
             historical_episodes: Past episodes to search
+            limit: If given, return only the top `limit` matches using
+                   a heap/partition select instead of a full sort
 
         Returns:
             List of (episode, similarity_score) tuples, sorted by score
         """
-        similar = []
-
-        for hist_episode in historical_episodes:
-            # Skip if same episode
-            if hist_episode.id == current_episode.id:
-                continue
-
-            # Calculate similarity
-            similarity = self._calculate_similarity(current_episode, hist_episode)
-
-            if similarity >= self.min_similarity:
-                similar.append((hist_episode, similarity))
-
-        # Sort by similarity (highest first)
-        similar.sort(key=lambda x: x[1], reverse=True)
+        candidates = [
+            ep for ep in historical_episodes if ep.id != current_episode.id
+        ]
+        if not candidates:
+            return []
+
+        # Query-side features are extracted once and shared across the
+        # whole history instead of being recomputed per comparison
+        cur_files = current_episode.file_paths
+        cur_keywords = self._episode_keywords(current_episode)
+        cur_sig = getattr(current_episode, '_summary_simhash', None)
+
+        scores = [
+            self._score_against(hist_episode, cur_files,
+                                current_episode.episode_type, cur_keywords,
+                                query_sig=cur_sig)
+            for hist_episode in candidates
+        ]
+
+        if NUMPY_AVAILABLE and len(candidates) >= self.VECTORIZE_THRESHOLD:
+            # One vectorized pass: threshold then descending sort on
+            # the surviving indices only
+            arr = np.asarray(scores, dtype=np.float32)
+            keep = np.flatnonzero(arr >= self.min_similarity)
+            if limit is not None and limit < keep.size:
+                # O(N) partition selects the top scores, then only
+                # those few get sorted
+                keep = keep[np.argpartition(-arr[keep], limit - 1)[:limit]]
+            # Stable descending sort keeps tie order identical to the
+            # scalar fallback
+            order = keep[np.argsort(-arr[keep], kind='stable')]
+            similar = [(candidates[i], float(arr[i])) for i in order]
+        else:
+            similar = [
+                (ep, score) for ep, score in zip(candidates, scores)
+                if score >= self.min_similarity
+            ]
+            if limit is not None and limit < len(similar):
+                # O(N log k) heap select; like sorted()[:k] for ties
+                similar = heapq.nlargest(limit, similar,
+                                         key=operator.itemgetter(1))
+            else:
+                similar.sort(key=lambda x: x[1], reverse=True)
 
         logger.debug(
             f"Found {len(similar)} similar episodes to {current_episode.id[:8]} "
@@ -164,37 +258,111 @@ class PatternDetector:
         Returns:
             Similarity score (0.0 to 1.0)
         """
+        similarity = self._score_against(
+            ep2, ep1.file_paths, ep1.episode_type,
+            self._episode_keywords(ep1),
+            query_sig=getattr(ep1, '_summary_simhash', None)
+        )
+
+        logger.debug(
+            f"Similarity({ep1.id[:8]}, {ep2.id[:8]}): {similarity:.2f}"
+        )
+
+        return similarity
+
+    def _score_against(
+        self,
+        episode: Episode,
+        files: set,
+        episode_type: str,
+        keywords: Set[str],
+        query_sig: Optional[int] = None
+    ) -> float:
+        """Score one historical episode against precomputed query features
+
+        Weights: file overlap 40%, type match 30%, text similarity 30%.
+        Taking the query's files/type/keywords as arguments lets
+        find_similar_episodes extract them once for the whole history.
+        When both sides carry a SimHash signature (set at episode
+        close), text similarity is estimated from Hamming distance
+        instead of re-tokenizing the summaries.
+        """
         scores = []
 
         # File overlap (Jaccard similarity)
-        if ep1.file_paths or ep2.file_paths:
-            intersection = len(ep1.file_paths & ep2.file_paths)
-            union = len(ep1.file_paths | ep2.file_paths)
+        if files or episode.file_paths:
+            intersection = len(files & episode.file_paths)
+            union = len(files) + len(episode.file_paths) - intersection
             file_score = intersection / union if union > 0 else 0.0
-            scores.append(('file_overlap', file_score, 0.4))
+            scores.append((file_score, 0.4))
 
         # Episode type match
-        type_score = 1.0 if ep1.episode_type == ep2.episode_type else 0.0
-        scores.append(('type_match', type_score, 0.3))
+        type_score = 1.0 if episode_type == episode.episode_type else 0.0
+        scores.append((type_score, 0.3))
+
+        # Upper-bound prune: text contributes at most its full 0.3
+        # weight, so when even a perfect text match cannot reach the
+        # threshold, skip scoring it entirely
+        partial = sum(score * weight for score, weight in scores)
+        reachable_weight = sum(weight for _, weight in scores) + 0.3
+        if (partial + 0.3) / reachable_weight < self.min_similarity:
+            return 0.0
 
-        # Text similarity (simple keyword overlap)
-        text_score = self._text_similarity(ep1.summary, ep2.summary)
-        scores.append(('text_similarity', text_score, 0.3))
+        # Text similarity: signature compare when possible, keyword
+        # overlap otherwise
+        hist_sig = getattr(episode, '_summary_simhash', None)
+        if query_sig is not None and hist_sig is not None:
+            text_score = self._signature_similarity(query_sig, hist_sig)
+        else:
+            text_score = _jaccard_cached(
+                *_canonical_pair(frozenset(keywords),
+                                 self._episode_keywords(episode))
+            )
+        scores.append((text_score, 0.3))
 
         # Weighted average
-        total_weight = sum(weight for _, _, weight in scores)
+        total_weight = sum(weight for _, weight in scores)
         if total_weight == 0:
             return 0.0
 
-        weighted_sum = sum(score * weight for _, score, weight in scores)
-        similarity = weighted_sum / total_weight
+        return sum(score * weight for score, weight in scores) / total_weight
 
-        logger.debug(
-            f"Similarity({ep1.id[:8]}, {ep2.id[:8]}): {similarity:.2f} "
-            f"[file={scores[0][1]:.2f}, type={scores[1][1]:.2f}, text={scores[2][1]:.2f}]"
-        )
+    @staticmethod
+    def _extract_keywords(text: str) -> Set[str]:
+        """Extract keywords (lowercase, filter stopwords/short words)"""
+        if not text:
+            return set()
+        return {
+            w for w in text.lower().split()
+            if len(w) > 2 and w not in _STOPWORDS
+        }
 
-        return similarity
+    @classmethod
+    def _episode_keywords(cls, episode: Episode) -> frozenset:
+        """Keywords for an episode, reusing tokens cached at close()
+
+        Closed episodes carry a pre-split `_tokens` frozenset, so only
+        the stopword filter runs here; open episodes fall back to full
+        extraction from the raw summary. Returns a frozenset so the
+        result can key the memoized Jaccard below.
+        """
+        tokens = getattr(episode, '_tokens', None)
+        if tokens is not None:
+            return frozenset(
+                w for w in tokens if len(w) > 2 and w not in _STOPWORDS
+            )
+        return frozenset(cls._extract_keywords(episode.summary))
+
+    @staticmethod
+    def _signature_similarity(sig1: int, sig2: int) -> float:
+        """Estimate text similarity from two SimHash signatures
+
+        One XOR plus a popcount replaces tokenizing both summaries.
+        Unrelated texts agree on ~32 of 64 bits by chance, so agreement
+        is rescaled so that chance level maps to 0.0.
+        """
+        agreement = 1.0 - (sig1 ^ sig2).bit_count() / 64.0
+        return max(0.0, 2.0 * agreement - 1.0)
 
     def _text_similarity(self, text1: str, text2: str) -> float:
         """
@@ -207,27 +375,10 @@ class PatternDetector:
         Returns:
             Similarity score (0.0 to 1.0)
         """
-        if not text1 or not text2:
-            return 0.0
-
-        # Extract keywords (lowercase, filter common words)
-        stopwords = {'the', 'a', 'an', 'in', 'on', 'at', 'to', 'for', 'of', 'and', 'or', 'but'}
-
-        def extract_keywords(text: str) -> Set[str]:
-            words = text.lower().split()
-            return {w for w in words if len(w) > 2 and w not in stopwords}
-
-        keywords1 = extract_keywords(text1)
-        keywords2 = extract_keywords(text2)
-
-        if not keywords1 or not keywords2:
-            return 0.0
-
-        # Jaccard similarity
-        intersection = len(keywords1 & keywords2)
-        union = len(keywords1 | keywords2)
-
-        return intersection / union if union > 0 else 0.0
+        return _jaccard_cached(
+            *_canonical_pair(frozenset(self._extract_keywords(text1)),
+                             frozenset(self._extract_keywords(text2)))
+        )
 
     def detect_recurring_patterns(
         self,
@@ -249,48 +400,49 @@ class PatternDetector:
         Returns:
             List of pattern dictionaries
         """
-        patterns = []
-
-        # 1. Recurring error keywords
+        # Single pass feeding all three counters; each Counter.update
+        # runs in C instead of a dedicated Python loop per pattern kind
         error_keywords = Counter()
-        for episode in episodes:
-            if episode.episode_type == "bugfix":
-                keywords = self._extract_error_keywords(episode.summary)
-                error_keywords.update(keywords)
-
-        for keyword, count in error_keywords.items():
-            if count >= min_occurrences:
-                patterns.append({
-                    'type': 'recurring_error',
-                    'keyword': keyword,
-                    'occurrences': count,
-                    'message': f"'{keyword}' error occurred {count} times"
-                })
-
-        # 2. Frequently modified files
         file_counter = Counter()
+        type_counter = Counter()
         for episode in episodes:
+            if episode.episode_type == "bugfix":
+                summary_lower = (getattr(episode, '_summary_lower', None)
+                                 or episode.summary.lower())
+                error_keywords.update(set(_ERROR_KEYWORD_RE.findall(summary_lower)))
             file_counter.update(episode.file_paths)
-
-        for file_path, count in file_counter.items():
-            if count >= min_occurrences:
-                patterns.append({
-                    'type': 'frequent_file',
-                    'file': file_path,
-                    'occurrences': count,
-                    'message': f"'{file_path}' modified in {count} episodes"
-                })
-
-        # 3. Episode type distribution
-        type_counter = Counter(ep.episode_type for ep in episodes)
-        for ep_type, count in type_counter.items():
-            if count >= min_occurrences:
-                patterns.append({
-                    'type': 'episode_type_pattern',
-                    'episode_type': ep_type,
-                    'occurrences': count,
-                    'message': f"{count} {ep_type} episodes"
-                })
+            type_counter[episode.episode_type] += 1
+
+        patterns = [
+            {
+                'type': 'recurring_error',
+                'keyword': keyword,
+                'occurrences': count,
+                'message': f"'{keyword}' error occurred {count} times"
+            }
+            for keyword, count in error_keywords.items()
+            if count >= min_occurrences
+        ]
+        patterns += [
+            {
+                'type': 'frequent_file',
+                'file': file_path,
+                'occurrences': count,
+                'message': f"'{file_path}' modified in {count} episodes"
+            }
+            for file_path, count in file_counter.items()
+            if count >= min_occurrences
+        ]
+        patterns += [
+            {
+                'type': 'episode_type_pattern',
+                'episode_type': ep_type,
+                'occurrences': count,
+                'message': f"{count} {ep_type} episodes"
+            }
+            for ep_type, count in type_counter.items()
+            if count >= min_occurrences
+        ]
 
         logger.info(f"Detected {len(patterns)} recurring patterns")
         return patterns
@@ -308,15 +460,9 @@ class PatternDetector:
         if not text:
             return set()
 
-        # Common error keywords
-        error_terms = {
-            'error', 'exception', 'bug', 'fail', 'crash', 'issue',
-            'typeerror', 'valueerror', 'attributeerror', 'keyerror',
-            'nullpointer', 'undefined', 'null', 'nan'
-        }
-
-        words = set(text.lower().split())
-        return words & error_terms
+        # IGNORECASE scans the original text directly; only the few
+        # matches get lowercased rather than the whole summary
+        return {match.lower() for match in _ERROR_KEYWORD_RE.findall(text)}
 
     def find_file_comodification_patterns(
         self,
@@ -333,27 +479,55 @@ class PatternDetector:
         Returns:
             List of co-modification pattern dictionaries
         """
-        # Count file pairs that appear together
-        pair_counts = defaultdict(int)
-
+        # Apriori prune: a pair can only reach min_support if both of
+        # its files do individually, so count singletons first and
+        # drop infrequent files before the O(k^2) pair enumeration
+        file_support = Counter()
         for episode in episodes:
-            files = sorted(episode.file_paths)
-            # Generate all pairs
-            for i, file1 in enumerate(files):
-                for file2 in files[i+1:]:
-                    pair = (file1, file2)
-                    pair_counts[pair] += 1
+            file_support.update(episode.file_paths)
+        frequent = {
+            path for path, count in file_support.items()
+            if count >= min_support
+        }
+
+        if NUMPY_AVAILABLE and len(frequent) >= self.COOC_THRESHOLD:
+            # Wide vocabulary: one membership-matrix product counts
+            # every pair at once instead of enumerating combinations
+            vocab = sorted(frequent)
+            index = {path: i for i, path in enumerate(vocab)}
+            membership = np.zeros((len(episodes), len(vocab)), dtype=np.int32)
+            for row, episode in enumerate(episodes):
+                for path in frequent.intersection(episode.file_paths):
+                    membership[row, index[path]] = 1
+            cooc = membership.T @ membership
+            # Upper triangle only: vocab is sorted, so (i, j) with
+            # i < j matches the sorted-pair canonical form
+            ii, jj = np.nonzero(np.triu(cooc, k=1) >= min_support)
+            pair_counts = {
+                (vocab[i], vocab[j]): int(cooc[i, j])
+                for i, j in zip(ii.tolist(), jj.tolist())
+            }
+        else:
+            # Count file pairs that appear together; sorting
+            # canonicalizes each pair and combinations + Counter.update
+            # count them in C
+            pair_counts = Counter()
+            for episode in episodes:
+                files = frequent.intersection(episode.file_paths)
+                if len(files) > 1:
+                    pair_counts.update(combinations(sorted(files), 2))
 
         # Filter by minimum support
-        patterns = []
-        for (file1, file2), count in pair_counts.items():
-            if count >= min_support:
-                patterns.append({
-                    'type': 'file_comodification',
-                    'files': [file1, file2],
-                    'occurrences': count,
-                    'message': f"'{file1}' and '{file2}' modified together {count} times"
-                })
+        patterns = [
+            {
+                'type': 'file_comodification',
+                'files': [file1, file2],
+                'occurrences': count,
+                'message': f"'{file1}' and '{file2}' modified together {count} times"
+            }
+            for (file1, file2), count in pair_counts.items()
+            if count >= min_support
+        ]
 
         logger.info(f"Found {len(patterns)} co-modification patterns")
         return patterns
@@ -401,16 +575,17 @@ class HintGenerator:
 
         similar_episodes = self.pattern_detector.find_similar_episodes(
             current_episode,
-            historical_episodes
+            historical_episodes,
+            limit=max_hints
         )
 
-        for hist_episode, similarity in similar_episodes[:max_hints]:
+        for hist_episode, similarity in similar_episodes:
             hint = Hint(
                 hint_type="similar_episode",
                 title=f"Similar to past {hist_episode.episode_type}",
                 message=self._format_similar_episode_message(current_episode, hist_episode),
                 confidence=similarity,
-                source_episodes=[hist_episode.id],
+                source_episodes=(hist_episode.id,),
                 context={
                     'similar_episode_id': hist_episode.id,
                     'similar_episode_type': hist_episode.episode_type,
@@ -472,20 +647,23 @@ class HintGenerator:
         """
         hints = []
 
+        summary_lower = (getattr(current_episode, '_summary_lower', None)
+                         or current_episode.summary.lower())
+
         # Check for recurring errors
         for pattern in patterns:
             if pattern['type'] == 'recurring_error':
                 # Check if current episode involves this error
                 if current_episode.episode_type == "bugfix":
                     keyword = pattern['keyword']
-                    if keyword in current_episode.summary.lower():
+                    if keyword in summary_lower:
                         hint = Hint(
                             hint_type="pattern_warning",
                             title=f"Recurring issue: {keyword}",
                             message=f"This '{keyword}' error has occurred {pattern['occurrences']} times before. "
                                     f"Review past solutions.",
                             confidence=0.8,
-                            source_episodes=[],
+                            source_episodes=(),
                             context={
                                 'pattern_type': 'recurring_error',
                                 'keyword': keyword,
@@ -530,7 +708,7 @@ class HintGenerator:
                         f"  • {success_ep.summary}\n"
                         f"  • Common files: {', '.join(list(common_files)[:3])}",
                 confidence=0.7,
-                source_episodes=[success_ep.id],
+                source_episodes=(success_ep.id,),
                 context={
                     'success_episode_id': success_ep.id,
                     'success_episode_summary': success_ep.summary,
@@ -574,7 +752,7 @@ class HintGenerator:
                     message=f"When modifying '{files[0]}', you typically also modify '{files[1]}' "
                             f"({pattern['occurrences']} times before)",
                     confidence=0.6,
-                    source_episodes=[],
+                    source_episodes=(),
                     context={
                         'file': files[0],
                         'related_file': files[1],
@@ -589,7 +767,7 @@ class HintGenerator:
                     message=f"When modifying '{files[1]}', you typically also modify '{files[0]}' "
                             f"({pattern['occurrences']} times before)",
                     confidence=0.6,
-                    source_episodes=[],
+                    source_episodes=(),
                     context={
                         'file': files[1],
                         'related_file': files[0],
@@ -628,9 +806,11 @@ class ProactiveHintEngine:
         self.hint_generator = HintGenerator(self.pattern_detector)
         self.max_hints_per_type = max_hints_per_type
 
-        # Cache for patterns
+        # Cache for patterns, shared by every hint family; versioned
+        # by episode count so builder growth invalidates it
         self._pattern_cache = {}
         self._cache_timestamp = None
+        self._cache_episode_count = None
         self._cache_ttl = timedelta(minutes=5)
 
         logger.info("ProactiveHintEngine initialized")
@@ -714,9 +894,10 @@ class ProactiveHintEngine:
         """
         now = datetime.now()
 
-        # Check cache
+        # Check cache: fresh AND mined over the same episode set
         if (self._cache_timestamp is not None and
-            now - self._cache_timestamp < self._cache_ttl):
+            now - self._cache_timestamp < self._cache_ttl and
+            self._cache_episode_count == len(episodes)):
             logger.debug("Using cached patterns")
             return self._pattern_cache
 
@@ -730,6 +911,7 @@ class ProactiveHintEngine:
             'comodification': comodification
         }
         self._cache_timestamp = now
+        self._cache_episode_count = len(episodes)
 
         return self._pattern_cache
 
@@ -743,10 +925,18 @@ class ProactiveHintEngine:
         historical = self.episode_builder.get_closed_episodes(limit=100)
         patterns = self._get_patterns(historical)
 
+        jaccard_info = _jaccard_cached.cache_info()
+
         return {
             'total_episodes': len(historical),
             'recurring_patterns': len(patterns['recurring']),
             'comodification_patterns': len(patterns['comodification']),
             'min_similarity': self.pattern_detector.min_similarity,
-            'max_hints_per_type': self.max_hints_per_type
+            'max_hints_per_type': self.max_hints_per_type,
+            'jaccard_cache': {
+                'hits': jaccard_info.hits,
+                'misses': jaccard_info.misses,
+                'size': jaccard_info.currsize,
+                'max_size': jaccard_info.maxsize
+            }
         }
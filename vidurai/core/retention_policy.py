@@ -66,6 +66,35 @@ class RetentionContext:
     # Project context
     project_path: str
 
+    @classmethod
+    def from_memory_table(cls, table, project_path: str) -> 'RetentionContext':
+        """
+        Build a context from an in-process MemoryTable
+
+        Salience counts and ages come from the table's columnar
+        statistics — one pass over the columns instead of one attribute
+        read per memory. Size/token figures use the same rough
+        estimates as the database-backed path.
+        """
+        counts = table.salience_counts()
+        ages = table.ages_days()
+        total = len(table)
+
+        return cls(
+            total_memories=total,
+            high_salience_count=counts['HIGH'] + counts['CRITICAL'],
+            medium_salience_count=counts['MEDIUM'],
+            low_salience_count=counts['LOW'],
+            noise_salience_count=counts['NOISE'],
+            avg_age_days=(sum(ages) / total) if ages else 0.0,
+            oldest_memory_days=max(ages) if ages else 0.0,
+            total_size_mb=total * 0.001,  # Rough estimate
+            estimated_tokens=total * 100,  # Rough estimate: 100 tokens per memory
+            memories_added_last_day=0,
+            memories_accessed_last_day=0,
+            project_path=project_path,
+        )
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for logging/debugging"""
         return {
@@ -311,10 +340,23 @@ class RLPolicy(RetentionPolicy):
     The RL agent learns optimal policies over time.
     """
 
+    # Exploration prior: even while exploring, mostly do nothing and
+    # only occasionally try a destructive retention action. Keeps early
+    # (high-epsilon) sessions from running compression on most cycles.
+    DEFAULT_ACTION_PRIOR = {
+        'do_nothing': 0.9,
+        'compress_now': 0.03,
+        'decay_low_value': 0.03,
+        'consolidate': 0.02,
+        'compress_aggressive': 0.02,
+    }
+
     def __init__(
         self,
         reward_profile: str = "BALANCED",
-        storage_dir: str = "~/.vidurai"
+        storage_dir: str = "~/.vidurai",
+        action_prior: Optional[Dict[str, float]] = None,
+        seed: Optional[int] = None
     ):
         """
         Initialize RL-based policy
@@ -322,6 +364,10 @@ class RLPolicy(RetentionPolicy):
         Args:
             reward_profile: BALANCED, COST_FOCUSED, or QUALITY_FOCUSED
             storage_dir: Where to store Q-table and experiences
+            action_prior: RL action name → exploration weight; defaults
+                to DEFAULT_ACTION_PRIOR (strongly favors do_nothing)
+            seed: Optional RNG seed — seeded policies explore
+                reproducibly (mainly for tests and A/B comparisons)
         """
         try:
             from .rl_agent_v2 import VismritiRLAgent, RewardProfile, Action
@@ -334,10 +380,19 @@ class RLPolicy(RetentionPolicy):
             }
             profile = profile_map.get(reward_profile.upper(), RewardProfile.BALANCED)
 
+            # Resolve prior (action names → Action enum)
+            prior_config = action_prior or self.DEFAULT_ACTION_PRIOR
+            prior = {
+                Action(name): weight
+                for name, weight in prior_config.items()
+            }
+
             # Initialize RL agent
             self.agent = VismritiRLAgent(
                 reward_profile=profile,
-                storage_dir=storage_dir
+                storage_dir=storage_dir,
+                action_prior=prior,
+                seed=seed
             )
 
             # Store mapping classes
@@ -501,7 +556,9 @@ def create_retention_policy(
     elif policy_type == "rl_based":
         return RLPolicy(
             reward_profile=kwargs.get('reward_profile', 'BALANCED'),
-            storage_dir=kwargs.get('storage_dir', '~/.vidurai')
+            storage_dir=kwargs.get('storage_dir', '~/.vidurai'),
+            action_prior=kwargs.get('action_prior'),
+            seed=kwargs.get('seed')
         )
     else:
         raise ValueError(f"Unknown policy type: {policy_type}. Use 'rule_based' or 'rl_based'")
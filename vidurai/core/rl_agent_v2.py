@@ -10,10 +10,17 @@ import random
 import json
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from datetime import datetime
 from enum import Enum
-from collections import defaultdict
+from collections import defaultdict, deque
+
+# Optional: vectorized reward calculation over outcome batches
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 
 class Action(Enum):
@@ -37,6 +44,17 @@ class Action(Enum):
     DO_NOTHING = "do_nothing"
 
 
+# Built once; random.choice over a tuple avoids rebuilding list(Action)
+# on every exploration step
+_ACTIONS = tuple(Action)
+
+# Exploitation scan order: DO_NOTHING first so it wins ties between
+# equally valued (e.g. all-unvisited) actions
+_EXPLOIT_ORDER = (Action.DO_NOTHING,) + tuple(
+    action for action in _ACTIONS if action is not Action.DO_NOTHING
+)
+
+
 class RewardProfile(Enum):
     """
     User-defined priorities for the reward function
@@ -69,23 +87,43 @@ class MemoryState:
     # Recent performance
     recent_compressions: int = 0
     recent_decays: int = 0
-    
-    def to_hash(self) -> str:
+
+    # Memoized to_key() result (states are immutable snapshots)
+    _key: Optional[Tuple[int, ...]] = field(default=None, repr=False, compare=False)
+
+    def to_key(self) -> Tuple[int, ...]:
         """
-        Create discrete state hash for Q-table
+        Create discrete state key for Q-table
         Bucketize continuous values for generalization
+
+        Returns a tuple of bucket ints: tuples hash faster than the
+        formatted string and avoid per-lookup string building in the
+        decide/learn hot path. The result is memoized — experiences are
+        re-sampled across replay batches, so each state is bucketized
+        once rather than once per replay.
         """
+        key = self._key
+        if key is not None:
+            return key
+
         # Discretize values into buckets
         wm_bucket = min(self.working_memory_count // 5, 10)  # 0-50 in steps of 5
         em_bucket = min(self.episodic_memory_count // 100, 10)
         token_bucket = min(self.total_tokens // 500, 20)
-        
+
         entropy_bucket = int(self.average_entropy * 10)  # 0-10
         importance_bucket = int(self.average_importance * 10)
-        
+
         msg_bucket = min(self.messages_since_last_compression // 3, 5)
-        
-        return f"{wm_bucket}|{em_bucket}|{token_bucket}|{entropy_bucket}|{importance_bucket}|{msg_bucket}"
+
+        key = (wm_bucket, em_bucket, token_bucket,
+               entropy_bucket, importance_bucket, msg_bucket)
+        self._key = key
+        return key
+
+    def to_hash(self) -> str:
+        """String form of to_key(), used for JSON persistence"""
+        return "|".join(map(str, self.to_key()))
 
 
 @dataclass
@@ -127,6 +165,61 @@ class Outcome:
 
         return total_reward
 
+    @staticmethod
+    def calculate_rewards_batch(
+        tokens_saved,
+        retrieval_accuracy,
+        information_loss,
+        profile: RewardProfile,
+        user_satisfaction=None,
+    ):
+        """
+        Vectorized calculate_reward over parallel arrays of outcomes
+
+        One matrix-vector product against the precomputed profile
+        weights replaces N scalar calls — the win that matters for
+        experience-replay minibatches. Matches calculate_reward
+        exactly for each row.
+
+        Args:
+            tokens_saved: Array of token counts saved per outcome
+            retrieval_accuracy: Array of accuracies (0-1)
+            information_loss: Array of losses (0-1)
+            profile: User's priority profile
+            user_satisfaction: Optional array (0-1); defaults to 0.5
+
+        Returns:
+            Array of rewards (list when NumPy is unavailable)
+        """
+        if NUMPY_AVAILABLE:
+            features = np.stack([
+                np.asarray(tokens_saved, dtype=np.float64),
+                np.asarray(retrieval_accuracy, dtype=np.float64),
+                np.asarray(information_loss, dtype=np.float64),
+            ], axis=1)
+            rewards = features @ _PROFILE_WEIGHTS[profile]
+            if user_satisfaction is None:
+                rewards += 0.5 * 30
+            else:
+                rewards = rewards + np.asarray(user_satisfaction,
+                                               dtype=np.float64) * 30
+            return rewards
+
+        # Scalar fallback mirroring calculate_reward
+        weights = RewardFunction.PROFILES[profile]
+        if user_satisfaction is None:
+            user_satisfaction = [0.5] * len(tokens_saved)
+        return [
+            (tokens / 10) * weights['token_weight']
+            + accuracy * 50 * weights['quality_weight']
+            - loss * 100 * weights['loss_penalty']
+            + satisfaction * 30
+            for tokens, accuracy, loss, satisfaction in zip(
+                tokens_saved, retrieval_accuracy,
+                information_loss, user_satisfaction
+            )
+        ]
+
 
 @dataclass
 class Experience:
@@ -173,6 +266,20 @@ class RewardFunction:
     }
 
 
+if NUMPY_AVAILABLE:
+    # Per-profile weight vectors for the batched reward path; columns
+    # are tokens_saved, retrieval_accuracy, information_loss with the
+    # scaling constants from calculate_reward folded in
+    _PROFILE_WEIGHTS = {
+        profile: np.array([
+            weights['token_weight'] / 10.0,
+            weights['quality_weight'] * 50.0,
+            -weights['loss_penalty'] * 100.0,
+        ], dtype=np.float64)
+        for profile, weights in RewardFunction.PROFILES.items()
+    }
+
+
 class ExperienceBuffer:
     """
     Stores experiences for learning
@@ -184,7 +291,9 @@ class ExperienceBuffer:
     def __init__(self, max_size: int = 10000, storage_dir: str = "~/.vidurai"):
         self.max_size = max_size
         self.storage_path = Path(storage_dir).expanduser() / "experiences.jsonl"
-        self.buffer: List[Experience] = []
+        # Ring buffer: deque with maxlen evicts the oldest experience
+        # in O(1), where list.pop(0) shifted the whole buffer
+        self.buffer: deque = deque(maxlen=max_size)
         
         # Create storage directory
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
@@ -194,28 +303,31 @@ class ExperienceBuffer:
     
     def add(self, experience: Experience):
         """Add experience to buffer and persist"""
+        # maxlen drops the oldest entry automatically
         self.buffer.append(experience)
-        
-        # Maintain max size
-        if len(self.buffer) > self.max_size:
-            self.buffer.pop(0)
-        
+
         # Persist to disk
         self._save_experience(experience)
-    
+
     def sample(self, batch_size: int = 32) -> List[Experience]:
         """Sample random batch for learning"""
         if len(self.buffer) < batch_size:
-            return self.buffer.copy()
+            return list(self.buffer)
         return random.sample(self.buffer, batch_size)
     
     def _save_experience(self, exp: Experience):
         """Append experience to JSONL file"""
+        state = asdict(exp.state)
+        next_state = asdict(exp.next_state)
+        # Drop the to_key() memo — internal cache, not part of the state
+        state.pop('_key', None)
+        next_state.pop('_key', None)
+
         data = {
-            'state': asdict(exp.state),
+            'state': state,
             'action': exp.action.value,
             'reward': exp.reward,
-            'next_state': asdict(exp.next_state),
+            'next_state': next_state,
             'timestamp': exp.timestamp.isoformat(),
         }
         
@@ -264,6 +376,14 @@ class QLearningPolicy:
     Q(s,a) ← Q(s,a) + α[r + γ·max Q(s',a') - Q(s,a)]
     """
     
+    # Traces below this are dropped when decayed (keeps the dict sparse)
+    TRACE_FLOOR = 1e-4
+
+    # Cold-start Q-value for DO_NOTHING in near-capacity states: the
+    # agent starts out assuming that sitting on a full memory system is
+    # bad, rather than having to stumble into the penalty first
+    PESSIMISTIC_INIT = -10.0
+
     def __init__(
         self,
         epsilon_max: float = 0.3,
@@ -271,27 +391,62 @@ class QLearningPolicy:
         epsilon_decay: float = 0.003,
         alpha: float = 0.1,
         gamma: float = 0.9,
+        trace_decay: float = 0.6,
+        action_prior: Optional[Dict[Action, float]] = None,
+        seed: Optional[int] = None,
         storage_dir: str = "~/.vidurai"
     ):
         """
         Initialize Q-learning policy
-        
+
         Args:
             epsilon_max: Initial exploration rate (youth)
             epsilon_min: Final exploration rate (maturity)
             epsilon_decay: How quickly to mature
             alpha: Learning rate
             gamma: Discount factor (future rewards)
+            trace_decay: Eligibility trace decay λ (0 = plain one-step
+                Q-learning; >0 propagates each reward through recently
+                visited state-action pairs, naive Q(λ))
+            action_prior: Optional Action → weight mapping biasing the
+                exploration branch (None = uniform random). Lets the
+                agent explore destructive actions less often.
+            seed: Optional RNG seed. Seeded policies make exploration
+                reproducible (deterministic tests, comparable runs);
+                None keeps fresh entropy.
         """
         self.epsilon_max = epsilon_max
         self.epsilon_min = epsilon_min
         self.epsilon_decay = epsilon_decay
         self.alpha = alpha
         self.gamma = gamma
-        
-        # Q-table: state_hash → action → expected_reward
+        self.trace_decay = trace_decay
+
+        self.action_prior = action_prior
+        self._prior_weights: Optional[List[float]] = (
+            [action_prior.get(action, 0.0) for action in _ACTIONS]
+            if action_prior else None
+        )
+
+        # Q-table: state_key (bucket tuple) → action → expected_reward
         # NOTE: Using regular dict instead of defaultdict for pickle compatibility
-        self.q_table: Dict[str, Dict[Action, float]] = {}
+        self.q_table: Dict[Tuple[int, ...], Dict[Action, float]] = {}
+
+        # Eligibility traces: (state_key, action) → trace value.
+        # Sparse on purpose — only recently visited pairs are held,
+        # decayed each step and cleared at episode boundaries.
+        self._traces: Dict[Tuple[Tuple[int, ...], Action], float] = {}
+
+        # Exploration randomness: uniforms are drawn in bulk into a
+        # buffer and consumed one per decision, refilled in a single
+        # vectorized call instead of one random.random() per decide.
+        # Both generators take the same seed so a seeded policy is
+        # fully reproducible regardless of which branch draws.
+        self._py_rng = random.Random(seed)
+        if NUMPY_AVAILABLE:
+            self._rng = np.random.default_rng(seed)
+            self._rand_buf = self._rng.random(4096, dtype=np.float32)
+            self._rand_idx = 0
         
         # Learning statistics
         self.episodes = 0
@@ -301,7 +456,7 @@ class QLearningPolicy:
         self.storage_path = Path(storage_dir).expanduser() / "q_table.json"
         self.load_q_table()
 
-    def _get_or_create_state(self, state_hash: str) -> Dict[Action, float]:
+    def _get_or_create_state(self, state_key: Tuple[int, ...]) -> Dict[Action, float]:
         """
         Get Q-values for a state, creating empty dict if needed.
 
@@ -309,15 +464,25 @@ class QLearningPolicy:
         Lambda functions in defaultdict prevent pickling, so we use explicit
         dict creation instead.
 
+        New near-capacity states (working-memory or token bucket at the
+        top of its range) are seeded with a penalty estimate for
+        DO_NOTHING instead of an empty dict — see PESSIMISTIC_INIT.
+
         Args:
-            state_hash: Discretized state identifier from MemoryState.to_hash()
+            state_key: Discretized bucket tuple from MemoryState.to_key()
 
         Returns:
             Dictionary mapping actions to Q-values for this state
         """
-        if state_hash not in self.q_table:
-            self.q_table[state_hash] = {}
-        return self.q_table[state_hash]
+        q_values = self.q_table.get(state_key)
+        if q_values is None:
+            q_values = {}
+            # Bucket layout: (wm, em, token, entropy, importance, msg);
+            # wm caps at 10 (≥50 memories), token at 20 (≥10k tokens)
+            if state_key[0] >= 10 or state_key[2] >= 19:
+                q_values[Action.DO_NOTHING] = self.PESSIMISTIC_INIT
+            self.q_table[state_key] = q_values
+        return q_values
 
     def get_epsilon(self) -> float:
         """
@@ -329,67 +494,143 @@ class QLearningPolicy:
         epsilon = self.epsilon_min + (self.epsilon_max - self.epsilon_min) * \
                   math.exp(-self.epsilon_decay * self.episodes)
         return epsilon
-    
+
+    def _next_uniform(self) -> float:
+        """Next uniform in [0, 1) from the prefilled buffer"""
+        if not NUMPY_AVAILABLE:
+            return self._py_rng.random()
+        if self._rand_idx == self._rand_buf.size:
+            self._rng.random(out=self._rand_buf, dtype=np.float32)
+            self._rand_idx = 0
+        value = self._rand_buf[self._rand_idx]
+        self._rand_idx += 1
+        return float(value)
+
     def select_action(self, state: MemoryState) -> Action:
         """
         ε-greedy action selection
         Balances exploration and exploitation
         """
         epsilon = self.get_epsilon()
-        
-        if random.random() < epsilon:
-            # Explore: random action
-            return random.choice(list(Action))
+
+        if self._next_uniform() < epsilon:
+            # Explore: random action, optionally biased by the prior
+            # (e.g. mostly DO_NOTHING, rarely aggressive compression)
+            if self._prior_weights is not None:
+                return self._py_rng.choices(_ACTIONS, weights=self._prior_weights)[0]
+            return self._py_rng.choice(_ACTIONS)
         else:
             # Exploit: best known action
             return self._best_action(state)
     
     def _best_action(self, state: MemoryState) -> Action:
-        """Get action with highest Q-value for state"""
-        state_hash = state.to_hash()
+        """
+        Get action with highest Q-value for state
+
+        Unvisited actions count as their zero initialization, so a
+        penalty-seeded DO_NOTHING loses to any untried alternative;
+        ties (e.g. a fresh state) resolve to DO_NOTHING.
+        """
+        state_key = state.to_key()
 
         # Use helper method to get or create state entry
-        q_values = self._get_or_create_state(state_hash)
+        q_values = self._get_or_create_state(state_key)
 
         if not q_values:
             return Action.DO_NOTHING  # Default when no learned Q-values
 
-        # Get action with max Q-value
-        best_action = max(q_values.items(), key=lambda x: x[1])[0]
-        return best_action
+        return max(_EXPLOIT_ORDER, key=lambda action: q_values.get(action, 0.0))
     
     def learn(self, experience: Experience):
         """
         Update Q-values from experience
 
         Q(s,a) ← Q(s,a) + α[r + γ·max Q(s',a') - Q(s,a)]
+
+        With trace_decay > 0 this is naive Q(λ): every recently visited
+        state-action pair holds an eligibility trace decayed by γλ per
+        step, and the TD error is applied to all of them at once, so a
+        reward propagates backwards through the episode instead of
+        needing one visit per step.
         """
-        state_hash = experience.state.to_hash()
-        next_state_hash = experience.next_state.to_hash()
+        state_key = experience.state.to_key()
+        next_state_key = experience.next_state.to_key()
 
         # Get current Q-value (use helper method for safe access)
-        state_q_values = self._get_or_create_state(state_hash)
+        state_q_values = self._get_or_create_state(state_key)
         current_q = state_q_values.get(experience.action, 0.0)
 
         # Best future Q-value
-        next_q_values = self._get_or_create_state(next_state_hash)
+        next_q_values = self._get_or_create_state(next_state_key)
         max_future_q = max(next_q_values.values()) if next_q_values else 0.0
 
-        # Q-learning update
-        new_q = current_q + self.alpha * (
-            experience.reward + self.gamma * max_future_q - current_q
-        )
+        # TD error
+        td_error = experience.reward + self.gamma * max_future_q - current_q
 
-        # Update Q-table
-        state_q_values[experience.action] = new_q
+        if self.trace_decay > 0:
+            # Decay existing traces, dropping the negligible ones
+            decay = self.gamma * self.trace_decay
+            traces = {
+                pair: decayed
+                for pair, trace in self._traces.items()
+                if (decayed := trace * decay) >= self.TRACE_FLOOR
+            }
+            # Replacing traces: the pair just visited gets full credit
+            traces[(state_key, experience.action)] = 1.0
+            self._traces = traces
+
+            # One TD error updates every traced pair
+            alpha_td = self.alpha * td_error
+            get_state = self.q_table.setdefault
+            for (traced_key, traced_action), trace in traces.items():
+                q_values = get_state(traced_key, {})
+                q_values[traced_action] = (
+                    q_values.get(traced_action, 0.0) + alpha_td * trace
+                )
+        else:
+            # Plain one-step Q-learning
+            state_q_values[experience.action] = current_q + self.alpha * td_error
 
         # Update statistics
         self.total_reward += experience.reward
-    
+
+    def learn_batch(self, experiences: List[Experience]):
+        """
+        Replay a minibatch of experiences through the TD update
+
+        One call amortizes the per-step method and attribute lookups
+        of learn() across the whole batch: the hyperparameters and the
+        Q-table accessor are bound to locals outside the loop.
+
+        Eligibility traces are not applied here — replayed experiences
+        are sampled out of trajectory order, so traces would assign
+        credit to unrelated pairs. Each replayed step gets the plain
+        one-step update.
+        """
+        alpha = self.alpha
+        gamma = self.gamma
+        get_state = self._get_or_create_state
+        batch_reward = 0.0
+
+        for experience in experiences:
+            state_q_values = get_state(experience.state.to_key())
+            current_q = state_q_values.get(experience.action, 0.0)
+
+            next_q_values = get_state(experience.next_state.to_key())
+            max_future_q = max(next_q_values.values()) if next_q_values else 0.0
+
+            state_q_values[experience.action] = current_q + alpha * (
+                experience.reward + gamma * max_future_q - current_q
+            )
+            batch_reward += experience.reward
+
+        self.total_reward += batch_reward
+
     def end_episode(self):
         """Mark end of episode (triggers epsilon decay)"""
         self.episodes += 1
-        
+        self._traces.clear()
+
         # Periodically save Q-table
         if self.episodes % 50 == 0:
             self.save_q_table()
@@ -398,8 +639,8 @@ class QLearningPolicy:
         """Persist Q-table to disk"""
         # Convert to JSON-serializable format
         serializable = {}
-        for state_hash, actions in self.q_table.items():
-            serializable[state_hash] = {
+        for state_key, actions in self.q_table.items():
+            serializable["|".join(map(str, state_key))] = {
                 action.value: q_value
                 for action, q_value in actions.items()
             }
@@ -423,11 +664,12 @@ class QLearningPolicy:
             with open(self.storage_path, 'r') as f:
                 data = json.load(f)
             
-            # Restore Q-table
+            # Restore Q-table ("a|b|c" keys back to bucket tuples)
             for state_hash, actions in data['q_table'].items():
+                state_key = tuple(int(b) for b in state_hash.split('|'))
+                q_values = self.q_table.setdefault(state_key, {})
                 for action_str, q_value in actions.items():
-                    action = Action(action_str)
-                    self.q_table[state_hash][action] = q_value
+                    q_values[Action(action_str)] = q_value
             
             # Restore statistics
             self.episodes = data.get('episodes', 0)
@@ -495,14 +737,20 @@ class VismritiRLAgent:
     def __init__(
         self,
         reward_profile: RewardProfile = RewardProfile.BALANCED,
-        storage_dir: str = "~/.vidurai"
+        storage_dir: str = "~/.vidurai",
+        action_prior: Optional[Dict[Action, float]] = None,
+        seed: Optional[int] = None
     ):
         """
         Initialize RL Agent
-        
+
         Args:
             reward_profile: User's priority (cost vs. quality)
             storage_dir: Where to store experiences and Q-table
+            action_prior: Optional Action → weight bias for the
+                exploration branch (see QLearningPolicy)
+            seed: Optional RNG seed for reproducible exploration
+                (see QLearningPolicy)
         """
         self.reward_profile = reward_profile
 
@@ -527,7 +775,9 @@ class VismritiRLAgent:
             print("")
 
         # Core components
-        self.policy = QLearningPolicy(storage_dir=storage_dir)
+        self.policy = QLearningPolicy(storage_dir=storage_dir,
+                                      action_prior=action_prior,
+                                      seed=seed)
         self.experience_buffer = ExperienceBuffer(storage_dir=storage_dir)
 
         # Current episode state
@@ -633,6 +883,17 @@ class VismritiRLAgent:
         self.current_state = None
         self.current_action = None
     
+    def replay(self, batch_size: int = 32):
+        """
+        Learn from a random minibatch of stored experiences
+
+        Args:
+            batch_size: Number of experiences to replay
+        """
+        batch = self.experience_buffer.sample(batch_size)
+        if batch:
+            self.policy.learn_batch(batch)
+
     def end_episode(self):
         """Mark end of episode (conversation)"""
         self.policy.end_episode()
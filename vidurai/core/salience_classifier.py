@@ -17,10 +17,17 @@ Biological Mapping:
 जय विदुराई! 🕉️
 """
 
+import re
+
 from vidurai.core.data_structures_v3 import SalienceLevel, Memory
 from typing import Dict, List
 
 
+def _compile_keywords(keywords: List[str]) -> "re.Pattern":
+    """Compile a keyword list into one alternation regex (substring match)"""
+    return re.compile('|'.join(re.escape(kw) for kw in keywords))
+
+
 class SalienceClassifier:
     """
     Classify memory salience (importance) based on biological tagging
@@ -67,6 +74,30 @@ class SalienceClassifier:
             "failed", "failure", "crash"
         ]
 
+        # One alternation regex per list: a single scan of the text
+        # instead of one substring scan per keyword
+        self._critical_re = _compile_keywords(self.critical_keywords)
+        self._high_re = _compile_keywords(self.high_keywords)
+        self._low_re = _compile_keywords(self.low_keywords)
+        self._noise_re = _compile_keywords(self.noise_keywords)
+        self._error_re = _compile_keywords(self.error_keywords)
+
+        # All four combined-text lists in one automaton-style pattern:
+        # classify() walks the text once and records which categories
+        # matched (via lastgroup) instead of scanning once per list.
+        # The LOW list stays separate — it only checks verbatim.
+        self._combined_re = re.compile('|'.join(
+            '(?P<{}>{})'.format(
+                name, '|'.join(re.escape(kw) for kw in keywords)
+            )
+            for name, keywords in (
+                ('error', self.error_keywords),
+                ('critical', self.critical_keywords),
+                ('high', self.high_keywords),
+                ('noise', self.noise_keywords),
+            )
+        ))
+
     def classify(self, memory: Memory) -> SalienceLevel:
         """
         Classify memory salience
@@ -89,16 +120,24 @@ class SalienceClassifier:
         gist_lower = memory.gist.lower() if memory.gist else ""
         combined = f"{verbatim_lower} {gist_lower}"
 
+        # One pass over the text, noting every keyword category that
+        # appears; the priority rules below read the flags. Errors
+        # outrank everything, so stop scanning once one is seen.
+        matched = set()
+        for match in self._combined_re.finditer(combined):
+            matched.add(match.lastgroup)
+            if match.lastgroup == 'error':
+                break
+
         # Rule 0: ERROR DETECTION - Errors should NOT be CRITICAL by default
         # This prevents TypeScript/Python errors from polluting CRITICAL tier
-        is_error = any(kw in combined for kw in self.error_keywords)
-        if is_error:
+        if 'error' in matched:
             # Errors start at MEDIUM unless explicitly marked otherwise
             # They will be further downgraded by aggregation if repeated
             return SalienceLevel.MEDIUM
 
         # Rule 1: CRITICAL - Explicit user commands
-        if any(kw in combined for kw in self.critical_keywords):
+        if 'critical' in matched:
             return SalienceLevel.CRITICAL
 
         # Rule 2: CRITICAL - Security/credentials metadata
@@ -108,21 +147,21 @@ class SalienceClassifier:
                 return SalienceLevel.CRITICAL
 
         # Rule 3: HIGH - Bug fixes and breakthroughs (reward signal)
-        if any(kw in combined for kw in self.high_keywords):
+        if 'high' in matched:
             return SalienceLevel.HIGH
 
         if memory.metadata and memory.metadata.get("solved_bug"):
             return SalienceLevel.HIGH
 
         # Rule 4: NOISE - System logs (no dopamine)
-        if any(kw in combined for kw in self.noise_keywords):
+        if 'noise' in matched:
             return SalienceLevel.NOISE
 
         if memory.metadata and memory.metadata.get("type") == "system_log":
             return SalienceLevel.NOISE
 
         # Rule 5: LOW - Casual interactions
-        if any(kw in verbatim_lower for kw in self.low_keywords):
+        if self._low_re.search(verbatim_lower):
             return SalienceLevel.LOW
 
         # Rule 6: LOW - Very short verbatim (likely trivial)
@@ -141,8 +180,9 @@ class SalienceClassifier:
         """
         stats = {level.name: 0 for level in SalienceLevel}
 
+        classify = self.classify
         for memory in memories:
-            salience = self.classify(memory)
+            salience = classify(memory)
             memory.salience = salience
             stats[salience.name] += 1
 
@@ -140,10 +140,23 @@ class SemanticCompressor:
         self.total_tokens_saved = 0
         self.compression_history = []
     
+    @staticmethod
+    def _message_tokens(message: Message) -> int:
+        """
+        Token count for a message, stamped on first use
+
+        Messages arriving without a token count get estimated once and
+        keep the result, so the repeated should_compress/window checks
+        over the same conversation don't re-tokenize every message.
+        """
+        if not message.tokens:
+            message.tokens = estimate_tokens(message.content)
+        return message.tokens
+
     def should_compress(self, messages: List[Message]) -> bool:
         """
         Determine if compression should be triggered
-        
+
         Criteria:
         1. Enough messages (>= threshold)
         2. Enough tokens (>= min_tokens)
@@ -151,11 +164,11 @@ class SemanticCompressor:
         """
         if len(messages) < self.compression_threshold:
             return False
-        
-        total_tokens = sum(msg.tokens or estimate_tokens(msg.content) for msg in messages)
+
+        total_tokens = sum(self._message_tokens(msg) for msg in messages)
         if total_tokens < self.min_tokens_to_compress:
             return False
-        
+
         return True
     
     def detect_compressible_window(
@@ -183,10 +196,7 @@ class SemanticCompressor:
         compressible = messages[:-keep_recent]
         
         # Calculate total tokens in compressible window
-        total_tokens = sum(
-            msg.tokens or estimate_tokens(msg.content) 
-            for msg in compressible
-        )
+        total_tokens = sum(self._message_tokens(msg) for msg in compressible)
         
         # Check if compressible window meets thresholds
         if len(compressible) < self.compression_threshold:
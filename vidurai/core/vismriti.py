@@ -4,7 +4,7 @@ Teaching AI the wisdom of what to forget
 """
 
 from enum import Enum
-from typing import List, Dict, Any
+from typing import Callable, List, Dict, Any
 from datetime import datetime, timedelta
 import time
 from loguru import logger
@@ -23,11 +23,15 @@ class VismritiEngine:
     Implements the four gates through which memories must pass
     """
     
-    def __init__(self, 
+    def __init__(self,
                  policies: List[ForgettingPolicy] = None,
-                 aggressive: bool = False):
+                 aggressive: bool = False,
+                 time_func: Callable[[], float] = time.time):
         self.policies = policies or list(ForgettingPolicy)
         self.aggressive = aggressive
+        # ✨ NEW: Injectable clock so tests can advance simulated time
+        # instead of sleeping through decay windows
+        self.time_func = time_func
         
         # ✨ NEW: Time thresholds in SECONDS for aggressive forgetting
         if aggressive:
@@ -90,7 +94,7 @@ class VismritiEngine:
         ✨ ENHANCED: Now uses seconds-based thresholds tied to importance
         """
         # Calculate age in seconds - FIX: Handle datetime properly
-        current_time = time.time()
+        current_time = self.time_func()
         
         # Convert memory timestamp to float if it's a datetime
         if hasattr(memory.timestamp, 'timestamp'):
@@ -5,7 +5,8 @@ Provides asyncio-based IPC server for communication with VS Code extension.
 Uses NDJSON protocol for bidirectional communication.
 
 Architecture:
-- Unix: asyncio.start_unix_server() on /tmp/vidurai-{uid}.sock
+- Linux: asyncio.start_unix_server() on abstract socket \0vidurai-{uid}
+- Other Unix: asyncio.start_unix_server() on /tmp/vidurai-{uid}.sock
 - Windows: asyncio Named Pipe using proactor event loop
 
 Features:
@@ -45,6 +46,11 @@ def get_pipe_path() -> str:
 
     if sys.platform == 'win32':
         return f"\\\\.\\pipe\\vidurai-{uid}"
+    elif sys.platform == 'linux':
+        # Abstract-namespace socket (leading NUL): lives outside the
+        # filesystem, so connects skip inode lookup and there is no
+        # stale .sock file to unlink after a crash
+        return f"\0vidurai-{uid}"
     else:
         return os.path.join(tempfile.gettempdir(), f"vidurai-{uid}.sock")
 
@@ -386,8 +392,9 @@ class IPCServer:
 
         logger.info(f"Starting IPC server on {self.pipe_path}")
 
-        # Clean up stale socket file on Unix
-        if sys.platform != 'win32':
+        # Clean up stale socket file on Unix (abstract-namespace
+        # sockets have no filesystem entry to remove)
+        if sys.platform != 'win32' and not self.pipe_path.startswith('\0'):
             socket_path = Path(self.pipe_path)
             if socket_path.exists():
                 try:
@@ -442,8 +449,9 @@ class IPCServer:
             self.server.close()
             await self.server.wait_closed()
 
-        # Clean up socket file on Unix
-        if sys.platform != 'win32':
+        # Clean up socket file on Unix (nothing to do for
+        # abstract-namespace sockets)
+        if sys.platform != 'win32' and not self.pipe_path.startswith('\0'):
             socket_path = Path(self.pipe_path)
             if socket_path.exists():
                 try:
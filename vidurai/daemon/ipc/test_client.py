@@ -15,11 +15,14 @@ import tempfile
 import os
 from pathlib import Path
 
-# Determine pipe path
+# Determine pipe path (mirrors vidurai.daemon.ipc.server.get_pipe_path)
 def get_pipe_path() -> str:
     uid = getpass.getuser()
     if sys.platform == 'win32':
         return f"\\\\.\\pipe\\vidurai-{uid}"
+    elif sys.platform == 'linux':
+        # Abstract-namespace socket — no filesystem entry
+        return f"\0vidurai-{uid}"
     else:
         return os.path.join(tempfile.gettempdir(), f"vidurai-{uid}.sock")
 
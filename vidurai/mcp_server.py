@@ -13,6 +13,16 @@ Architecture:
 import json
 import logging
 from http.server import HTTPServer, BaseHTTPRequestHandler
+
+# Optional C-accelerated JSON for response egress
+try:
+    import orjson
+
+    def _dumps_bytes(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _dumps_bytes(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
 from pathlib import Path
 from typing import Dict, Any, List
 import argparse
@@ -113,7 +123,7 @@ class MCPRequestHandler(BaseHTTPRequestHandler):
             self.send_header('Content-Type', 'application/json')
             self._send_cors_headers(origin)
             self.end_headers()
-            self.wfile.write(json.dumps(response).encode('utf-8'))
+            self.wfile.write(_dumps_bytes(response))
 
         except Exception as e:
             logger.error(f"Error handling POST request: {e}")
@@ -445,9 +455,14 @@ class MCPRequestHandler(BaseHTTPRequestHandler):
         logger.info(f"{self.client_address[0]} - {format % args}")
 
 
-def start_mcp_server(host: str = 'localhost', port: int = 8765, allow_all_origins: bool = False):
-    """Start MCP server"""
+def create_server(host: str = 'localhost', port: int = 8765, allow_all_origins: bool = False) -> HTTPServer:
+    """
+    Build a configured MCP HTTPServer without starting it
 
+    Separated from start_mcp_server() so tests can run the server
+    in-process (e.g. on an ephemeral port in a background thread)
+    instead of spawning a subprocess and sleeping through startup.
+    """
     # Initialize database
     try:
         MCPRequestHandler.database = MemoryDatabase()
@@ -464,14 +479,24 @@ def start_mcp_server(host: str = 'localhost', port: int = 8765, allow_all_origin
     else:
         logger.info("✓ CORS restrictions enabled (localhost + ChatGPT only)")
 
-    server = HTTPServer((host, port), MCPRequestHandler)
+    return HTTPServer((host, port), MCPRequestHandler)
+
+
+def start_mcp_server(host: str = 'localhost', port: int = 8765, allow_all_origins: bool = False):
+    """Start MCP server"""
+
+    server = create_server(host=host, port=port, allow_all_origins=allow_all_origins)
+
+    # Report the actual bound port (differs from the argument when port=0
+    # requests an ephemeral port, e.g. in parallel CI runs)
+    bound_port = server.server_address[1]
 
     logger.info("=" * 60)
     logger.info("🧠 Vidurai MCP Server")
     logger.info("=" * 60)
-    logger.info(f"Listening on: http://{host}:{port}")
-    logger.info(f"Health check: http://{host}:{port}/health")
-    logger.info(f"Capabilities: http://{host}:{port}/capabilities")
+    logger.info(f"Listening on: http://{host}:{bound_port}")
+    logger.info(f"Health check: http://{host}:{bound_port}/health")
+    logger.info(f"Capabilities: http://{host}:{bound_port}/capabilities")
     logger.info("=" * 60)
     logger.info("Tools available:")
     logger.info("  • get_project_context - Get AI-ready context")
@@ -28,9 +28,29 @@ from enum import Enum
 
 from vidurai.storage.migrations import run_migrations
 
+# Optional C-accelerated JSON for the tag write path (~3-5x faster
+# than stdlib in bulk inserts); falls back to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger("vidurai.storage")
 
 
+def _json_dumps(value) -> str:
+    """
+    Serialize to the JSON TEXT stored in the tags columns.
+
+    Always returns str (not bytes): the columns are TEXT, feed the FTS
+    index, and readers check isinstance(tags, str) before json.loads.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value).decode('utf-8')
+    return json.dumps(value)
+
+
 class SalienceLevel(Enum):
     """Memory importance levels aligned with Three-Kosha architecture"""
     CRITICAL = 5
@@ -184,13 +204,18 @@ class MemoryDatabase:
         - All writes are serialized through this single thread
         - WAL mode allows readers to proceed in parallel
         """
-        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        # cached_statements keeps the compiled form of the recurring
+        # INSERT/UPDATE statements on the connection, so the writer
+        # re-binds parameters instead of re-parsing SQL per task
+        conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                               cached_statements=256)
         conn.row_factory = sqlite3.Row
 
         # WAL Mode: Critical for allowing Readers while we write
         conn.execute("PRAGMA journal_mode=WAL")
         conn.execute("PRAGMA synchronous=NORMAL")
         conn.execute("PRAGMA foreign_keys=ON")
+        conn.execute("PRAGMA temp_store=MEMORY")
 
         logger.debug("Writer thread started (WAL mode enabled)")
 
@@ -530,7 +555,7 @@ class MemoryDatabase:
                     event_type,
                     file_path,
                     line_number,
-                    json.dumps(tags) if tags else None,
+                    _json_dumps(tags) if tags else None,
                     expires_at,
                     created_at_str
                 ))
@@ -549,7 +574,7 @@ class MemoryDatabase:
                     event_type,
                     file_path,
                     line_number,
-                    json.dumps(tags) if tags else None,
+                    _json_dumps(tags) if tags else None,
                     expires_at
                 ))
 
@@ -563,7 +588,7 @@ class MemoryDatabase:
                 memory_id,
                 gist,
                 verbatim,
-                json.dumps(tags) if tags else None
+                _json_dumps(tags) if tags else None
             ))
             future.result()
 
@@ -574,6 +599,88 @@ class MemoryDatabase:
             logger.error(f"Database error storing memory: {e}")
             raise
 
+    def store_memories_bulk(
+        self,
+        project_path: str,
+        rows: List[Dict],
+        identity: Optional[Dict] = None
+    ) -> int:
+        """
+        Store many memories in one writer transaction.
+
+        Ironclad Rule II: Uses the writer queue, via a single
+        transaction block — N memories cost one commit instead of N.
+        Each FTS row references last_insert_rowid() of the memory
+        insert immediately before it in the same transaction.
+
+        Args:
+            project_path: Path to the project (shared by all rows)
+            rows: Dicts with verbatim, gist, salience (SalienceLevel),
+                  event_type, and optional file_path, line_number,
+                  tags, retention_days, created_at
+            identity: Optional project identity
+
+        Returns:
+            Number of memories stored
+        """
+        if not rows:
+            return 0
+
+        try:
+            project_id = self.get_or_create_project(project_path, identity=identity)
+
+            queries = []
+            batch_time = datetime.now()  # One clock read for the whole batch
+            for row in rows:
+                expires_at = None
+                created_at = row.get('created_at')
+                retention_days = row.get('retention_days')
+                if retention_days:
+                    base_time = created_at if created_at else batch_time
+                    expires_at = (base_time + timedelta(days=retention_days)).isoformat()
+
+                tags = row.get('tags')
+                tags_json = _json_dumps(tags) if tags else None
+
+                if created_at:
+                    queries.append(("""
+                        INSERT INTO memories (
+                            project_id, verbatim, gist, salience, event_type,
+                            file_path, line_number, tags, expires_at, created_at
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """, (
+                        project_id, row['verbatim'], row['gist'],
+                        row['salience'].name, row['event_type'],
+                        row.get('file_path'), row.get('line_number'),
+                        tags_json, expires_at, created_at.isoformat()
+                    )))
+                else:
+                    queries.append(("""
+                        INSERT INTO memories (
+                            project_id, verbatim, gist, salience, event_type,
+                            file_path, line_number, tags, expires_at
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """, (
+                        project_id, row['verbatim'], row['gist'],
+                        row['salience'].name, row['event_type'],
+                        row.get('file_path'), row.get('line_number'),
+                        tags_json, expires_at
+                    )))
+
+                queries.append(("""
+                    INSERT INTO memories_fts (memory_id, gist, verbatim, tags)
+                    VALUES (last_insert_rowid(), ?, ?, ?)
+                """, (row['gist'], row['verbatim'], tags_json)))
+
+            self._enqueue_transaction(queries).result()
+
+            logger.debug(f"Stored {len(rows)} memories in one transaction")
+            return len(rows)
+
+        except Exception as e:
+            logger.error(f"Database error storing memories in bulk: {e}")
+            raise
+
     def process_memory_from_receipt(
         self,
         receipt_id: str,
@@ -620,7 +727,7 @@ class MemoryDatabase:
                         file_path, line_number, tags, expires_at, created_at
                     ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """
-                mem_params = (project_id, verbatim, gist, salience.name, event_type, file_path, line_number, json.dumps(tags) if tags else None, expires_at, created_at_str)
+                mem_params = (project_id, verbatim, gist, salience.name, event_type, file_path, line_number, _json_dumps(tags) if tags else None, expires_at, created_at_str)
             else:
                 mem_query = """
                     INSERT INTO memories (
@@ -628,9 +735,9 @@ class MemoryDatabase:
                         file_path, line_number, tags, expires_at
                     ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """
-                mem_params = (project_id, verbatim, gist, salience.name, event_type, file_path, line_number, json.dumps(tags) if tags else None, expires_at)
+                mem_params = (project_id, verbatim, gist, salience.name, event_type, file_path, line_number, _json_dumps(tags) if tags else None, expires_at)
             
-            fts_params = (gist, verbatim, json.dumps(tags) if tags else None)
+            fts_params = (gist, verbatim, _json_dumps(tags) if tags else None)
             processed_at = int(time.time() * 1000)
             
             future = SimpleFuture()
@@ -682,15 +789,23 @@ class MemoryDatabase:
         """
         Store multiple audience-specific gists for a memory.
 
-        Ironclad Rule II: Uses _enqueue for all writes.
+        Ironclad Rule II: Uses the actor queue for all writes.
+
+        All gists go through one transaction: a single queue round-trip
+        and a single commit instead of one per audience.
         """
+        if not gists:
+            return
+
         try:
-            for audience, gist in gists.items():
-                future = self._enqueue("""
+            future = self._enqueue_transaction([
+                ("""
                     INSERT OR REPLACE INTO audience_gists (memory_id, audience, gist)
                     VALUES (?, ?, ?)
                 """, (memory_id, audience, gist))
-                future.result()
+                for audience, gist in gists.items()
+            ])
+            future.result()
 
             logger.debug(f"Stored {len(gists)} audience gists for memory {memory_id}")
 
@@ -725,7 +840,7 @@ class MemoryDatabase:
                 new_gist,
                 new_salience,
                 occurrence_count,
-                json.dumps(tags),
+                _json_dumps(tags),
                 memory_id
             ))
             future.result()
@@ -738,7 +853,7 @@ class MemoryDatabase:
                 WHERE memory_id = ?
             """, (
                 new_gist,
-                json.dumps(tags),
+                _json_dumps(tags),
                 memory_id
             ))
             future.result()
@@ -1264,6 +1379,65 @@ class MemoryDatabase:
         finally:
             conn.close()
 
+    def get_audience_gists_bulk(
+        self,
+        memory_ids: List[int],
+        audience: Optional[str] = None
+    ) -> Dict[int, Dict[str, str]]:
+        """
+        Retrieve audience gists for many memories in one query.
+
+        One reader connection and one SELECT with an IN list replaces a
+        per-memory get_audience_gists call (each of which opened its own
+        connection).
+
+        Ironclad Rule III: Uses get_connection_for_reading for parallel reads.
+
+        Args:
+            memory_ids: Memory ids to fetch gists for
+            audience: Optional single audience to restrict to
+
+        Returns:
+            Mapping of memory_id -> {audience: gist}
+        """
+        if not memory_ids:
+            return {}
+
+        conn = self.get_connection_for_reading()
+        try:
+            cursor = conn.cursor()
+            placeholders = ','.join('?' * len(memory_ids))
+
+            if audience:
+                sql = f"""
+                    SELECT memory_id, audience, gist
+                    FROM audience_gists
+                    WHERE memory_id IN ({placeholders})
+                      AND audience = ?
+                """
+                params = list(memory_ids) + [audience]
+            else:
+                sql = f"""
+                    SELECT memory_id, audience, gist
+                    FROM audience_gists
+                    WHERE memory_id IN ({placeholders})
+                """
+                params = list(memory_ids)
+
+            results = cursor.execute(sql, params).fetchall()
+            gists: Dict[int, Dict[str, str]] = {}
+            for row in results:
+                gists.setdefault(row['memory_id'], {})[row['audience']] = row['gist']
+
+            logger.debug(f"Retrieved audience gists for {len(gists)} of {len(memory_ids)} memories")
+            return gists
+
+        except sqlite3.Error as e:
+            logger.error(f"Database error retrieving audience gists in bulk: {e}")
+            return {}
+        finally:
+            conn.close()
+
     def recall_memories(
         self,
         project_path: str,
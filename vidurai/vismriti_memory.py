@@ -15,6 +15,7 @@ Research Foundation: 104+ citations across neuroscience, AI, philosophy
 """
 
 import os
+import types
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 from pathlib import Path
@@ -59,6 +60,10 @@ STOP_WORDS = frozenset({
     "tell", "show", "explain", "describe", "give", "find", "get",
 })
 
+# Shared read-only empty metadata — avoids allocating a fresh dict on
+# every remember() call that passes no metadata
+_EMPTY_META = types.MappingProxyType({})
+
 # Phase 6: Event Bus integration
 try:
     from vidurai.core.event_bus import EventBus, publish_event
@@ -77,7 +82,7 @@ except Exception:
 
 # Optional gist extraction (requires OpenAI API key)
 try:
-    from vidurai.core.gist_extractor import GistExtractor
+    from vidurai.core.gist_extractor import GistExtractor, get_gist_extractor
     import openai  # Explicit check for optional dependency
     GIST_EXTRACTION_AVAILABLE = True
 except ImportError:
@@ -244,7 +249,7 @@ class VismritiMemory:
         # Phase 1: Gist Extraction (optional)
         self.enable_gist_extraction = enable_gist_extraction and GIST_EXTRACTION_AVAILABLE
         if self.enable_gist_extraction:
-            self.gist_extractor = GistExtractor(model="gpt-4o-mini")
+            self.gist_extractor = get_gist_extractor(model="gpt-4o-mini")
         else:
             self.gist_extractor = None
 
@@ -395,7 +400,9 @@ class VismritiMemory:
             ... )
         """
 
-        metadata = metadata or {}
+        # Read-only sentinel when no metadata given: all uses below are
+        # lookups, and pydantic copies it into a real dict on the Memory
+        metadata = metadata if metadata is not None else _EMPTY_META
 
         # Phase 1: Gist/Verbatim Split
         verbatim = content
@@ -575,6 +582,104 @@ class VismritiMemory:
 
         return memory
 
+    def remember_many(
+        self,
+        records: List[Dict[str, Any]],
+        extract_gist: bool = True
+    ) -> List[Memory]:
+        """
+        Store a batch of memories in one database transaction
+
+        Bulk counterpart to remember() for ingest-style workloads
+        (imports, replays, test fixtures): gist extraction and salience
+        classification run per record, but all rows go to the database
+        through a single writer transaction, so N memories cost one
+        commit instead of N. Per-memory aggregation, audience gists and
+        memory.created events are intentionally skipped — bulk loads
+        are history, not live activity.
+
+        Args:
+            records: Dicts with 'content' plus optional 'metadata',
+                     'salience' (SalienceLevel) and 'created_at'
+            extract_gist: Extract gists from content (default: True)
+
+        Returns:
+            List of created Memory objects
+
+        Example:
+            >>> memory.remember_many([
+            ...     {'content': f"Log entry {i}",
+            ...      'metadata': {'type': 'log'},
+            ...      'salience': SalienceLevel.LOW}
+            ...     for i in range(100)
+            ... ])
+        """
+        memories = []
+        rows = []
+        batch_time = datetime.now()  # One clock read instead of two per memory
+
+        for record in records:
+            content = record['content']
+            metadata = record.get('metadata') or _EMPTY_META
+
+            verbatim = content
+            if self.enable_gist_extraction and extract_gist and self.gist_extractor:
+                try:
+                    gist = self.gist_extractor.extract(verbatim, context=metadata)
+                except Exception as e:
+                    logger.warning(f"Gist extraction failed: {e}, using verbatim as gist")
+                    gist = verbatim[:100]
+            else:
+                gist = verbatim
+
+            memory = Memory(
+                verbatim=verbatim,
+                gist=gist,
+                metadata=metadata,
+                created_at=record.get('created_at') or batch_time,
+                last_accessed=batch_time
+            )
+
+            salience = record.get('salience')
+            if salience:
+                memory.salience = salience
+            else:
+                memory.salience = self.salience_classifier.classify(memory)
+
+            self.memories.append(memory)
+            memories.append(memory)
+
+            if self.db:
+                db_salience = DBSalienceLevel[memory.salience.name]
+                retention_days = {
+                    DBSalienceLevel.CRITICAL: None,  # Never expire
+                    DBSalienceLevel.HIGH: 90,
+                    DBSalienceLevel.MEDIUM: 30,
+                    DBSalienceLevel.LOW: 7,
+                    DBSalienceLevel.NOISE: 1
+                }.get(db_salience, 30)
+
+                rows.append({
+                    'verbatim': verbatim,
+                    'gist': gist,
+                    'salience': db_salience,
+                    'event_type': metadata.get('type', 'generic'),
+                    'file_path': metadata.get('file'),
+                    'line_number': metadata.get('line'),
+                    'tags': metadata.get('tags', []),
+                    'retention_days': retention_days,
+                    'created_at': record.get('created_at'),
+                })
+
+        if self.db and rows:
+            try:
+                self.db.store_memories_bulk(self.project_path, rows)
+            except Exception as e:
+                logger.error(f"Failed to store bulk memories in database: {e}")
+
+        logger.info(f"Stored {len(memories)} memories in bulk")
+        return memories
+
     def recall(
         self,
         query: str,
@@ -880,7 +985,17 @@ class VismritiMemory:
         Returns:
             RetentionContext with current metrics, or None if database unavailable
         """
-        if not self.db or not RETENTION_POLICY_AVAILABLE:
+        if not RETENTION_POLICY_AVAILABLE:
+            return None
+
+        if not self.db:
+            # No database: build from the in-process memories instead
+            # (one columnar pass via MemoryTable)
+            if self.memories:
+                from vidurai.core.data_structures_v3 import MemoryTable
+                return RetentionContext.from_memory_table(
+                    MemoryTable(self.memories), self.project_path
+                )
             return None
 
         try:
@@ -1145,16 +1260,17 @@ class VismritiMemory:
             if not memories:
                 return "[No relevant project context found]"
 
-            context = "# VIDURAI PROJECT CONTEXT\n\n"
-            context += f"Project: {Path(self.project_path).name}\n\n"
+            # Build via list + join: O(N) instead of quadratic str +=
+            parts = ["# VIDURAI PROJECT CONTEXT\n\n"]
+            parts.append(f"Project: {Path(self.project_path).name}\n\n")
 
             for mem in memories[:10]:
-                context += f"- **{mem.gist[:100]}**\n"
+                parts.append(f"- **{mem.gist[:100]}**\n")
                 if mem.metadata.get('file'):
-                    context += f"  - File: `{mem.metadata['file']}`\n"
-                context += "\n"
+                    parts.append(f"  - File: `{mem.metadata['file']}`\n")
+                parts.append("\n")
 
-            return context
+            return ''.join(parts)
 
         # Use database for efficient query
         try:
@@ -1172,9 +1288,10 @@ class VismritiMemory:
             if not memories:
                 return "[No relevant project context found]"
 
-            # Format as markdown
-            context = "# VIDURAI PROJECT CONTEXT\n\n"
-            context += f"Project: {Path(self.project_path).name}\n\n"
+            # Format as markdown — accumulate blocks in a list and join
+            # once at the end (str += copies the whole buffer each time)
+            parts = ["# VIDURAI PROJECT CONTEXT\n\n"]
+            parts.append(f"Project: {Path(self.project_path).name}\n\n")
 
             # Group by salience
             by_salience = {}
@@ -1187,15 +1304,16 @@ class VismritiMemory:
             # Phase 5: Enrich memories with audience-specific gists if requested
             if audience and self.db:
                 try:
+                    # One bulk query for all memories instead of one
+                    # lookup (and reader connection) per memory
+                    gists_by_id = self.db.get_audience_gists_bulk(
+                        [mem['id'] for mem in memories],
+                        audience=audience
+                    )
                     for mem in memories:
-                        audience_gists = self.db.get_audience_gists(
-                            mem['id'],
-                            audiences=[audience]
-                        )
-                        if audience in audience_gists:
-                            mem['audience_gist'] = audience_gists[audience]
-                        else:
-                            mem['audience_gist'] = mem['gist']  # Fallback to canonical
+                        mem_gists = gists_by_id.get(mem['id'], {})
+                        # Fallback to canonical when no audience gist stored
+                        mem['audience_gist'] = mem_gists.get(audience, mem['gist'])
                 except Exception as e:
                     logger.warning(f"Failed to enrich with audience gists: {e}")
                     # Set fallback for all
@@ -1211,13 +1329,13 @@ class VismritiMemory:
                 if salience not in by_salience:
                     continue
 
-                context += f"## {salience} Priority Memories\n\n"
+                parts.append(f"## {salience} Priority Memories\n\n")
                 for mem in by_salience[salience][:5]:  # Limit per category
                     # Use audience-specific gist if available
                     gist_to_display = mem.get('audience_gist', mem['gist'])
-                    context += f"- **{gist_to_display}**\n"
+                    parts.append(f"- **{gist_to_display}**\n")
                     if mem['file_path']:
-                        context += f"  - File: `{mem['file_path']}`\n"
+                        parts.append(f"  - File: `{mem['file_path']}`\n")
 
                     # Calculate age
                     created_at = datetime.fromisoformat(mem['created_at'])
@@ -1228,8 +1346,10 @@ class VismritiMemory:
                         age_str = "1 day ago"
                     else:
                         age_str = f"{age_days} days ago"
-                    context += f"  - Age: {age_str}\n"
-                    context += "\n"
+                    parts.append(f"  - Age: {age_str}\n")
+                    parts.append("\n")
+
+            context = ''.join(parts)
 
             # Truncate if too long (rough token estimate: 1 token ≈ 4 chars)
             max_chars = max_tokens * 4